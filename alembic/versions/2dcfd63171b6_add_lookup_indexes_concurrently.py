@@ -0,0 +1,52 @@
+"""add lookup indexes concurrently
+
+Revision ID: 2dcfd63171b6
+Revises: adbc4993fb43
+Create Date: 2026-10-16 11:05:31.402117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2dcfd63171b6'
+down_revision: Union[str, None] = 'adbc4993fb43'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (name, table, columns) - kept in one place so upgrade/downgrade stay in sync
+INDEXES = [
+    # Reverse lookups / FK checks when a permission is deleted
+    ('ix_role_permissions_permission_id', 'role_permissions', ['permission_id']),
+    # OAuth login: account by provider + provider-side user id
+    (
+        'ix_oauth_accounts_provider_id_provider_user_id',
+        'oauth_accounts',
+        ['provider_id', 'provider_user_id'],
+    ),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY builds without blocking writes, but cannot run inside a
+    # transaction block; IF NOT EXISTS keeps re-runs and create_all DBs safe.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name, table, columns,
+                if_not_exists=True, postgresql_concurrently=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name, table_name=table,
+                if_exists=True, postgresql_concurrently=True
+            )
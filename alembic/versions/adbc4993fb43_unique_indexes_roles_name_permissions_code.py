@@ -0,0 +1,48 @@
+"""unique indexes on roles.name and permissions.code
+
+Revision ID: adbc4993fb43
+Revises: 60007f977264
+Create Date: 2026-10-16 09:12:40.118204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+import sqlmodel
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'adbc4993fb43'
+down_revision: Union[str, None] = '60007f977264'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Names match the model-level indexes so autogenerate stays clean;
+    # IF NOT EXISTS makes this a no-op on databases built via create_all.
+    # CONCURRENTLY cannot run inside a transaction block.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_roles_name', 'roles', ['name'],
+            unique=True, if_not_exists=True, postgresql_concurrently=True
+        )
+        op.create_index(
+            'ix_permissions_code', 'permissions', ['code'],
+            unique=True, if_not_exists=True, postgresql_concurrently=True
+        )
+    # role_permissions(role_id) needs no index of its own: it is the leading
+    # column of the (role_id, permission_id) primary key.
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_permissions_code', table_name='permissions',
+            if_exists=True, postgresql_concurrently=True
+        )
+        op.drop_index(
+            'ix_roles_name', table_name='roles',
+            if_exists=True, postgresql_concurrently=True
+        )
@@ -113,6 +113,17 @@ class BaseRepository(Generic[ModelType]):
         result = await self.db.execute(query)
         return result.scalars().all(), total
 
+    async def _refresh_if_expired(self, obj: ModelType) -> None:
+        """
+        Reload `obj` after commit only if the session expired it.
+        
+        Models use Python-side defaults, so with expire_on_commit=False (as
+        configured in app.core.database) the instance is already current and
+        a refresh would be a wasted SELECT.
+        """
+        if self.db.sync_session.expire_on_commit:
+            await self.db.refresh(obj)
+
     async def create(self, obj_in: ModelType) -> ModelType:
         """
         Create a new record.
@@ -125,7 +136,7 @@ class BaseRepository(Generic[ModelType]):
         """
         self.db.add(obj_in)
         await self.db.commit()
-        await self.db.refresh(obj_in)
+        await self._refresh_if_expired(obj_in)
         return obj_in
     
     async def update(self, db_obj: ModelType, obj_in: dict) -> ModelType:
@@ -144,7 +155,7 @@ class BaseRepository(Generic[ModelType]):
         
         self.db.add(db_obj)
         await self.db.commit()
-        await self.db.refresh(db_obj)
+        await self._refresh_if_expired(db_obj)
         return db_obj
     
     async def delete(self, id: UUID) -> bool:
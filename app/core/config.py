@@ -25,6 +25,12 @@ class Settings(BaseSettings):
             f"{values.get('POSTGRES_SERVER')}/{values.get('POSTGRES_DB')}"
         )
 
+    # Database connection pool
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 3600  # seconds
+
     # Redis
     REDIS_HOST: str
     REDIS_PORT: int
@@ -46,6 +52,7 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    BCRYPT_ROUNDS: int = 12  # bcrypt cost factor (4-31)
     
     # OTP
     OTP_LENGTH: int = 6
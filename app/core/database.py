@@ -1,14 +1,39 @@
 from typing import AsyncGenerator
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from sqlmodel import SQLModel
 
 from app.core.config import settings
 
-engine = create_async_engine(settings.SQLALCHEMY_DATABASE_URI, echo=True, future=True)
+engine = create_async_engine(
+    settings.SQLALCHEMY_DATABASE_URI,
+    echo=True,
+    future=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,  # drop connections the server closed
+    pool_recycle=settings.DB_POOL_RECYCLE,
+)
 
 async def init_db():
+    """
+    Create any missing tables (development convenience; prefer Alembic).
+    
+    A single pg_tables lookup short-circuits the common case where the
+    schema already exists, skipping create_all's per-table catalog checks.
+    """
+    table_names = list(SQLModel.metadata.tables)
     async with engine.begin() as conn:
+        present = await conn.scalar(
+            text(
+                "SELECT count(*) FROM pg_catalog.pg_tables "
+                "WHERE schemaname = current_schema() AND tablename = ANY(:names)"
+            ),
+            {"names": table_names},
+        )
+        if present == len(table_names):
+            return
         # await conn.run_sync(SQLModel.metadata.drop_all)
         await conn.run_sync(SQLModel.metadata.create_all)
 
@@ -3,7 +3,7 @@ Permission management and RBAC utilities.
 """
 from typing import List, Optional
 
-from fastapi import Depends, HTTPException, status, Header
+from fastapi import Depends, HTTPException, Request, status, Header
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError
 from sqlmodel.ext.asyncio.session import AsyncSession
@@ -281,6 +281,7 @@ def require_permissions(required_permissions: List[str]):
         Dependency function
     """
     async def permission_checker(
+        request: Request,
         current_user: User = Depends(get_current_verified_user),
         db: AsyncSession = Depends(get_db)
     ) -> User:
@@ -288,7 +289,11 @@ def require_permissions(required_permissions: List[str]):
         from app.core.exceptions import PermissionDeniedError
         from app.core.schemas.response import ErrorCode
         
-        user_permissions = await get_user_permissions(current_user, db)
+        # Resolve permissions once per request; stacked checkers reuse the result
+        user_permissions = getattr(request.state, "user_permissions", None)
+        if user_permissions is None:
+            user_permissions = await get_user_permissions(current_user, db)
+            request.state.user_permissions = user_permissions
         
         # SUPER_ADMIN has all permissions
         if "*" in user_permissions:
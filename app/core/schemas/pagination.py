@@ -1,7 +1,10 @@
 """
 Common pagination schemas and utilities.
 """
-from typing import Generic, TypeVar, List, Optional
+import base64
+import binascii
+import json
+from typing import Any, Generic, TypeVar, List, Optional
 from pydantic import BaseModel, Field
 
 T = TypeVar('T')
@@ -52,3 +55,32 @@ class PaginatedResponse(BaseModel, Generic[T]):
             has_next=page < total_pages,
             has_prev=page > 1
         )
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encode keyset values (e.g. last row's sort key and id) as an opaque cursor.
+    Datetimes and UUIDs are serialized via str()/isoformat.
+    """
+    def _default(value: Any) -> str:
+        return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+    raw = json.dumps(list(values), default=_default, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
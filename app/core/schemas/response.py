@@ -92,6 +92,19 @@ class PaginatedResponse(SuccessResponse[PaginatedData[T]]):
     pass
 
 
+class CursorPaginatedData(BaseModel, Generic[T]):
+    """Keyset-paginated data structure (no total count)."""
+    items: List[T] = Field(..., description="List of items")
+    per_page: int = Field(..., description="Items per page")
+    has_next: bool = Field(False, description="Whether more items follow")
+    next_cursor: Optional[str] = Field(None, description="Cursor for the next page")
+
+
+class CursorPaginatedResponse(SuccessResponse[CursorPaginatedData[T]]):
+    """Keyset-paginated response wrapper."""
+    pass
+
+
 # Helper functions to create error responses
 def create_error_response(
     code: str,
@@ -4,6 +4,7 @@ import asyncio
 from datetime import datetime, timedelta
 from app.modules.audit.service import audit_service
 from app.modules.audit.models import AuditLog
+from app.core.mongo import mongodb
 
 @pytest.mark.asyncio
 async def test_audit_filtering_logic():
@@ -24,7 +25,6 @@ async def test_audit_filtering_logic():
     # We'll insert directly or we can just assume timestamps are close and test other fields first.
     # For timestamp filtering, we really should insert manually into collection to control time.
     
-    from app.core.mongo import mongodb
     db = mongodb.get_db()
     collection = db["audit_logs"]
     
@@ -5,6 +5,10 @@ from app.modules.roles.service import RoleService, PermissionService
 from app.modules.oauth.provider_service import OAuthProviderService
 from app.modules.audit.service import audit_service
 from app.core.mongo import mongodb
+from app.modules.auth.service import AuthService
+from app.core.security import hash_password
+from app.modules.users.models import User
+from app.constants.enums import UserType
 
 @pytest.fixture
 def role_service(session):
@@ -131,16 +135,11 @@ async def test_audit_list_logs(role_service, actor_id):
 
 @pytest.fixture
 def auth_service(session):
-    from app.modules.auth.service import AuthService
     return AuthService(session)
 
 @pytest.mark.asyncio
 async def test_auth_audit(auth_service, session):
     """Test audit logs for user registration and login."""
-    from app.core.security import hash_password
-    from app.modules.users.models import User
-    from app.constants.enums import UserType
-    
     # Register Customer
     # Assuming 'admin' object is defined elsewhere in the test setup or context
     # and this line is intended to be inserted here.
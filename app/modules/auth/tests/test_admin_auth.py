@@ -1,5 +1,6 @@
 import pytest
 import uuid
+from secrets import token_hex
 from app.modules.users.schemas import AdminCreate
 from app.modules.users.service import UserManagementService
 
@@ -21,7 +22,7 @@ class TestAdminAuth:
         This covers the code path that previously raised ModuleNotFoundError.
         """
         # 1. Create an Admin
-        unique_id = str(uuid.uuid4())[:8]
+        unique_id = token_hex(4)
         username = f"admin_{unique_id}"
         email = f"admin_{unique_id}@test.com"
         password = "AdminPass123!"
@@ -3,13 +3,13 @@ Basic authentication tests.
 Run with: pytest tests/test_auth.py -v
 """
 import pytest
-import uuid
+from secrets import token_hex
 
 
 @pytest.fixture
 async def test_user_data():
     """Test user data with unique email per test run."""
-    unique_id = str(uuid.uuid4())[:8]
+    unique_id = token_hex(4)
     return {
         "email": f"test_{unique_id}@example.com",
         "password": "TestPassword123!",
@@ -109,7 +109,7 @@ class TestOTP:
     
     async def test_otp_rate_limiting(self, client):
         """Test OTP rate limiting."""
-        unique_id = str(uuid.uuid4())[:8]
+        unique_id = token_hex(4)
         email = f"ratelimit_{unique_id}@example.com"
         
         # First request should succeed
@@ -2,9 +2,10 @@ import pytest
 from httpx import AsyncClient
 from uuid import uuid4
 from app.modules.users.models import User, Admin
-from app.core.security import get_password_hash
-from app.constants.enums import UserType
+from app.core.security import get_password_hash, generate_otp, hash_otp
+from app.constants.enums import UserType, OTPType
 from app.modules.roles.models import Role
+from app.core.cache import otp_key, set_cache
 
 @pytest.mark.asyncio
 async def test_auth_integration(client: AsyncClient, session):
@@ -99,10 +100,6 @@ async def test_full_auth_flow(client: AsyncClient, session):
     """
     Test complete user lifecycle: Register -> Verify -> Login -> Change Password.
     """
-    from app.core.security import generate_otp, hash_otp
-    from app.core.cache import otp_key, set_cache
-    from app.constants.enums import OTPType
-    
     email = f"customer_{uuid4()}@example.com"
     password = "CustomerPass123!"
     
@@ -3,12 +3,11 @@ Auth Service tests.
 """
 import pytest
 from uuid import uuid4
-from sqlmodel import select
 
 from app.modules.auth.service import AuthService
 from app.core.exceptions import AuthenticationError, ConflictError, NotFoundError
 from app.constants.enums import UserType
-from app.modules.users.models import User, Customer
+from app.modules.users.models import User
 from app.core.security import hash_password, generate_otp, hash_otp, verify_otp
 from app.core.mongo import mongodb
 
@@ -19,78 +18,77 @@ async def setup_mongo_connection():
     yield
     mongodb.close()
 
+def make_user(email: str, hashed_password: str, **overrides) -> User:
+    """Build an active, verified customer; override any field by keyword."""
+    fields = {
+        "first_name": "Test",
+        "last_name": "User",
+        "is_active": True,
+        "is_verified": True,
+        "user_type": UserType.CUSTOMER,
+    }
+    fields.update(overrides)
+    return User(email=email, hashed_password=hashed_password, **fields)
+
+# Fixed code so verification cases can name the correct OTP
+OTP = "482913"
+
+@pytest.fixture(scope="module")
+def hashed_otp():
+    """The (bcrypt) hash of OTP, computed once for the module."""
+    return hash_otp(OTP)
+
 class TestAuthService:
     """Test AuthService with real database."""
     
-    async def test_auth_service_init(self, session):
-        """Test AuthService initialization."""
-        service = AuthService(session)
-        assert service.db is session
+    @pytest.fixture(scope="class")
+    async def seeded_auth_users(self, class_session):
+        """Users shared by the class; bcrypt runs once for all of them."""
+        hashed_password = hash_password("testpassword123")
+        users = {
+            "active": make_user(
+                "auth_test@example.com", hashed_password,
+                first_name="Auth", last_name="Test"
+            ),
+            "inactive": make_user(
+                "inactive_test@example.com", hashed_password,
+                first_name="Inactive", is_active=False
+            ),
+            "existing": make_user(
+                "duplicate@example.com", hashed_password,
+                first_name="Existing", is_verified=False
+            ),
+        }
+        class_session.add_all(users.values())
+        await class_session.commit()
+        return users
     
     async def test_authenticate_user_not_found(self, session):
         """Test authentication with non-existent user."""
         service = AuthService(session)
         
-        with pytest.raises(AuthenticationError):
+        with pytest.raises(AuthenticationError, match="Invalid email or password"):
             await service.authenticate_user("nonexistent@example.com", "password")
     
-    async def test_authenticate_user_success(self, session):
+    async def test_authenticate_user_success(self, session, seeded_auth_users):
         """Test successful authentication."""
-        # Create a test user
-        user = User(
-            email="auth_test@example.com",
-            hashed_password=hash_password("testpassword123"),
-            first_name="Auth",
-            last_name="Test",
-            is_active=True,
-            is_verified=True,
-            user_type=UserType.CUSTOMER
-        )
-        session.add(user)
-        await session.commit()
-        
         service = AuthService(session)
         authenticated_user = await service.authenticate_user("auth_test@example.com", "testpassword123")
         
         assert authenticated_user.email == "auth_test@example.com"
     
-    async def test_authenticate_user_wrong_password(self, session):
+    async def test_authenticate_user_wrong_password(self, session, seeded_auth_users):
         """Test authentication with wrong password."""
-        # Create a test user
-        user = User(
-            email="wrong_pass_test@example.com",
-            hashed_password=hash_password("correctpassword"),
-            first_name="Wrong",
-            last_name="Pass",
-            is_active=True,
-            is_verified=True,
-            user_type=UserType.CUSTOMER
-        )
-        session.add(user)
-        await session.commit()
-        
         service = AuthService(session)
         
-        with pytest.raises(AuthenticationError):
-            await service.authenticate_user("wrong_pass_test@example.com", "wrongpassword")
+        with pytest.raises(AuthenticationError, match="Invalid email or password"):
+            await service.authenticate_user("auth_test@example.com", "wrongpassword")
     
-    async def test_authenticate_user_inactive(self, session):
+    async def test_authenticate_user_inactive(self, session, seeded_auth_users):
         """Test authentication with inactive user."""
-        user = User(
-            email="inactive_test@example.com",
-            hashed_password=hash_password("testpassword123"),
-            first_name="Inactive",
-            last_name="User",
-            is_active=False,
-            is_verified=True,
-            user_type=UserType.CUSTOMER
-        )
-        session.add(user)
-        await session.commit()
-        
         service = AuthService(session)
         
-        with pytest.raises(AuthenticationError):
+        with pytest.raises(AuthenticationError, match="Account is inactive"):
             await service.authenticate_user("inactive_test@example.com", "testpassword123")
     
     async def test_register_customer_success(self, session):
@@ -108,28 +106,15 @@ class TestAuthService:
         assert user.user_type == UserType.CUSTOMER
         
         # Verify customer profile
-        result = await session.execute(select(Customer).where(Customer.user_id == user.id))
-        customer = result.scalar_one()
-        assert customer.first_name == "New"
-        assert customer.last_name == "Customer"
+        await session.refresh(user, attribute_names=["customer"])
+        assert user.customer.first_name == "New"
+        assert user.customer.last_name == "Customer"
     
-    async def test_register_customer_duplicate(self, session):
+    async def test_register_customer_duplicate(self, session, seeded_auth_users):
         """Test registering customer with duplicate email."""
-        # Create existing user
-        user = User(
-            email="duplicate@example.com",
-            hashed_password=hash_password("password123"),
-            first_name="Existing",
-            last_name="User",
-            is_active=True,
-            user_type=UserType.CUSTOMER
-        )
-        session.add(user)
-        await session.commit()
-        
         service = AuthService(session)
         
-        with pytest.raises(ConflictError):
+        with pytest.raises(ConflictError, match="already exists"):
             await service.register_customer(
                 email="duplicate@example.com",
                 password="password123",
@@ -141,26 +126,25 @@ class TestAuthService:
         """Test reset password for non-existent user."""
         service = AuthService(session)
         
-        with pytest.raises(NotFoundError):
+        with pytest.raises(NotFoundError, match="User not found"):
             await service.reset_password("nonexistent@example.com", "newpassword")
 
 
 class TestOTPFunctions:
     """Test OTP-related functions."""
     
-    async def test_generate_otp_format(self):
+    def test_generate_otp_format(self):
         """Test that generated OTP has correct format."""
         otp = generate_otp()
         assert len(otp) == 6
         assert otp.isdigit()
     
-    async def test_otp_hashing(self):
+    @pytest.mark.parametrize("candidate,expected", [
+        (OTP, True),
+        ("000000", False),
+        ("", False),
+        ("abcdef", False),
+    ], ids=["correct", "wrong", "empty", "non_numeric"])
+    def test_otp_verification(self, hashed_otp, candidate, expected):
         """Test OTP hashing and verification."""
-        otp = generate_otp()
-        hashed = hash_otp(otp)
-        
-        # Correct OTP should verify
-        assert verify_otp(otp, hashed) is True
-        
-        # Wrong OTP should not verify
-        assert verify_otp("000000", hashed) is False
+        assert verify_otp(candidate, hashed_otp) is expected
@@ -2,6 +2,7 @@
 import pytest
 from httpx import AsyncClient
 from app.core.schemas.response import ErrorCode
+from app.modules.users.models import User
 
 @pytest.mark.asyncio
 class TestChangePasswordValidation:
@@ -24,7 +25,6 @@ class TestChangePasswordValidation:
         
         # We need to verify email to login (Customer)
         # Verify directly in DB using the injected session
-        from app.modules.users.models import User
         from sqlmodel import select
         
         result = await session.execute(select(User).where(User.email == unique_email))
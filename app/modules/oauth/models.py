@@ -6,7 +6,7 @@ from typing import Optional
 from uuid import UUID, uuid4
 
 from sqlmodel import Field, SQLModel
-from sqlalchemy import Column, JSON
+from sqlalchemy import Column, Index, JSON
 
 
 class OAuthProvider(SQLModel, table=True):
@@ -42,5 +42,7 @@ class OAuthAccount(SQLModel, table=True):
 
     # Unique constraint: one provider account per user per provider
     __table_args__ = (
+        # OAuth login looks accounts up by (provider_id, provider_user_id)
+        Index("ix_oauth_accounts_provider_id_provider_user_id", "provider_id", "provider_user_id"),
         {"schema": None},
     )
@@ -74,7 +74,7 @@ class OAuthProviderService:
         )
         
         return {
-            "id": str(created_provider.id),
+            "id": created_provider.id,
             "name": created_provider.name,
             "display_name": created_provider.display_name,
             "icon": created_provider.icon,
@@ -90,6 +90,9 @@ class OAuthProviderService:
     ) -> dict:
         """
         List all OAuth providers with pagination.
+        
+        UUIDs and datetimes are returned raw; the response model's serializer
+        formats them, so no per-row str()/isoformat() is done here.
         """
         skip = (page - 1) * per_page
         
@@ -105,12 +108,12 @@ class OAuthProviderService:
         return {
             "items": [
                 {
-                    "id": str(p.id),
+                    "id": p.id,
                     "name": p.name,
                     "display_name": p.display_name,
                     "icon": p.icon,
                     "is_active": p.is_active,
-                    "created_at": p.created_at.isoformat()
+                    "created_at": p.created_at
                 }
                 for p in providers
             ],
@@ -135,7 +138,7 @@ class OAuthProviderService:
             )
         
         return {
-            "id": str(provider.id),
+            "id": provider.id,
             "name": provider.name,
             "display_name": provider.display_name,
             "icon": provider.icon,
@@ -145,8 +148,8 @@ class OAuthProviderService:
             "user_info_url": provider.user_info_url,
             "scopes": provider.scopes,
             "is_active": provider.is_active,
-            "created_at": provider.created_at.isoformat(),
-            "updated_at": provider.updated_at.isoformat()
+            "created_at": provider.created_at,
+            "updated_at": provider.updated_at
         }
     
     async def update_provider(self, provider_id: UUID, actor_id: UUID, request: Optional[Request] = None, **update_data) -> None:
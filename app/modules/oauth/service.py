@@ -19,6 +19,9 @@ from app.constants.enums import UserType
 from app.core.schemas.response import ErrorCode
 from app.core.exceptions import AuthenticationError, NotFoundError, ConflictError
 
+# Token exchange and user info are fetched back to back over one client
+OAUTH_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=10, keepalive_expiry=30)
+
 
 class OAuthService:
     """Service for OAuth2 authentication."""
@@ -97,11 +100,12 @@ class OAuthService:
                 message=f"Provider '{provider_name}' not found"
             )
             
-        # 1. Exchange code for access token
-        token_data = await self._exchange_code(provider, code, redirect_uri)
-        
-        # 2. Get user info from provider
-        user_info = await self._get_user_info(provider, token_data["access_token"])
+        async with httpx.AsyncClient(limits=OAUTH_HTTP_LIMITS) as client:
+            # 1. Exchange code for access token
+            token_data = await self._exchange_code(client, provider, code, redirect_uri)
+            
+            # 2. Get user info from provider
+            user_info = await self._get_user_info(client, provider, token_data["access_token"])
         
         # 3. Find or create user
         user = await self._get_or_create_user(provider, user_info)
@@ -116,7 +120,13 @@ class OAuthService:
             "token_type": "bearer"
         }
     
-    async def _exchange_code(self, provider: OAuthProvider, code: str, redirect_uri: str) -> dict:
+    async def _exchange_code(
+        self,
+        client: httpx.AsyncClient,
+        provider: OAuthProvider,
+        code: str,
+        redirect_uri: str
+    ) -> dict:
         """Exchange authorization code for access token."""
         data = {
             "client_id": provider.client_id,
@@ -128,34 +138,37 @@ class OAuthService:
         
         headers = {"Accept": "application/json"}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(provider.token_url, data=data, headers=headers)
+        response = await client.post(provider.token_url, data=data, headers=headers)
+        
+        if response.status_code != 200:
+            raise AuthenticationError(
+                error_code=ErrorCode.OAUTH_ERROR,
+                message=f"Failed to retrieve access token from {provider.name}"
+            )
             
-            if response.status_code != 200:
-                raise AuthenticationError(
-                    error_code=ErrorCode.OAUTH_ERROR,
-                    message=f"Failed to retrieve access token from {provider.name}"
-                )
-                
-            return response.json()
+        return response.json()
             
-    async def _get_user_info(self, provider: OAuthProvider, access_token: str) -> dict:
+    async def _get_user_info(
+        self,
+        client: httpx.AsyncClient,
+        provider: OAuthProvider,
+        access_token: str
+    ) -> dict:
         """Fetch user profile from provider."""
         headers = {
             "Authorization": f"Bearer {access_token}",
             "Accept": "application/json"
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(provider.user_info_url, headers=headers)
+        response = await client.get(provider.user_info_url, headers=headers)
+        
+        if response.status_code != 200:
+            raise AuthenticationError(
+                error_code=ErrorCode.OAUTH_ERROR,
+                message=f"Failed to retrieve user info from {provider.name}"
+            )
             
-            if response.status_code != 200:
-                raise AuthenticationError(
-                    error_code=ErrorCode.OAUTH_ERROR,
-                    message=f"Failed to retrieve user info from {provider.name}"
-                )
-                
-            return response.json()
+        return response.json()
     
     async def _get_or_create_user(self, provider: OAuthProvider, user_info: dict) -> User:
         """Find existing user or create new one."""
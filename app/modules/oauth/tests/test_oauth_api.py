@@ -1,6 +1,8 @@
 
 import pytest
 from unittest.mock import patch, AsyncMock
+from app.modules.oauth import endpoints as oauth_endpoints
+from app.modules.oauth.models import OAuthProvider
 
 
 class TestOAuth:
@@ -19,7 +21,6 @@ class TestOAuth:
     async def test_get_login_url(self, client, session):
         """Test generating login URL."""
         # First seed a provider for testing
-        from app.modules.oauth.models import OAuthProvider
         provider = OAuthProvider(
             name="google",
             display_name="Google",
@@ -59,7 +60,7 @@ class TestOAuth:
         assert data["success"] is False
         assert data["error"]["code"] == "OAUTH_003"
 
-    @patch("app.modules.oauth.endpoints.OAuthService")
+    @patch.object(oauth_endpoints, "OAuthService")
     async def test_oauth_callback_success(self, mock_service_cls, client):
         """Test successful OAuth callback (mocked)."""
         # Setup mock with AsyncMock for the async method
@@ -14,14 +14,36 @@ async def setup_mongo_connection():
     yield
     mongodb.close()
 
+
+@pytest.fixture
+async def active_and_inactive_providers(seed):
+    """One active and one inactive provider."""
+    active_provider = OAuthProvider(
+        name="active_test_provider",
+        display_name="Active Test",
+        client_id="client123",
+        client_secret="secret123",
+        authorization_url="https://auth.example.com",
+        token_url="https://token.example.com",
+        user_info_url="https://userinfo.example.com",
+        is_active=True
+    )
+    inactive_provider = OAuthProvider(
+        name="inactive_test_provider",
+        display_name="Inactive Test",
+        client_id="client456",
+        client_secret="secret456",
+        authorization_url="https://auth2.example.com",
+        token_url="https://token2.example.com",
+        user_info_url="https://userinfo2.example.com",
+        is_active=False
+    )
+    return await seed(active_provider, inactive_provider)
+
+
 class TestOAuthService:
     """Test OAuthService with real database."""
     
-    async def test_oauth_service_init(self, session):
-        """Test OAuthService initialization."""
-        service = OAuthService(session)
-        assert service.db is session
-    
     async def test_list_providers_empty(self, session):
         """Test listing providers when none exist."""
         service = OAuthService(session)
@@ -29,33 +51,8 @@ class TestOAuthService:
         # Result could be empty or have providers depending on test order
         assert isinstance(providers, list)
     
-    async def test_list_providers_only_active(self, session):
+    async def test_list_providers_only_active(self, session, active_and_inactive_providers):
         """Test listing providers returns only active ones."""
-        # Create active and inactive providers
-        active_provider = OAuthProvider(
-            name="active_test_provider",
-            display_name="Active Test",
-            client_id="client123",
-            client_secret="secret123",
-            authorization_url="https://auth.example.com",
-            token_url="https://token.example.com",
-            user_info_url="https://userinfo.example.com",
-            is_active=True
-        )
-        inactive_provider = OAuthProvider(
-            name="inactive_test_provider",
-            display_name="Inactive Test",
-            client_id="client456",
-            client_secret="secret456",
-            authorization_url="https://auth2.example.com",
-            token_url="https://token2.example.com",
-            user_info_url="https://userinfo2.example.com",
-            is_active=False
-        )
-        session.add(active_provider)
-        session.add(inactive_provider)
-        await session.commit()
-        
         service = OAuthService(session)
         providers = await service.list_providers()
         
@@ -64,9 +61,19 @@ class TestOAuthService:
         assert "active_test_provider" in provider_names
         assert "inactive_test_provider" not in provider_names
     
+    async def test_get_login_url(self, session, active_and_inactive_providers):
+        """Test login URL points at the provider with our client id."""
+        active_provider, _ = active_and_inactive_providers
+        service = OAuthService(session)
+        
+        url = await service.get_login_url(active_provider.name, "http://callback")
+        
+        assert url.startswith("https://auth.example.com?")
+        assert "client_id=client123" in url
+    
     async def test_get_login_url_provider_not_found(self, session):
         """Test getting login URL for non-existent provider."""
         service = OAuthService(session)
         
-        with pytest.raises(NotFoundError):
+        with pytest.raises(NotFoundError, match="Provider 'nonexistent_provider' not found"):
             await service.get_login_url("nonexistent_provider", "http://callback")
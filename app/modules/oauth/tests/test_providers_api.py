@@ -4,6 +4,13 @@ Run with: pytest tests/test_oauth_providers.py -v
 """
 import pytest
 import uuid
+from app.modules.oauth.schemas import (
+    OAuthProviderCreateRequest,
+    OAuthProviderUpdateRequest,
+    OAuthProviderStatusRequest
+)
+from app.constants.permissions import PermissionEnum
+from app.constants.error_codes import ErrorCode
 
 
 class TestOAuthProviderEndpointsUnauthorized:
@@ -85,8 +92,6 @@ class TestOAuthProviderSchemas:
     
     def test_create_request_valid(self):
         """Test valid create request schema."""
-        from app.modules.oauth.schemas import OAuthProviderCreateRequest
-        
         data = OAuthProviderCreateRequest(
             name="github",
             display_name="GitHub",
@@ -103,8 +108,6 @@ class TestOAuthProviderSchemas:
     
     def test_create_request_defaults(self):
         """Test create request with defaults."""
-        from app.modules.oauth.schemas import OAuthProviderCreateRequest
-        
         data = OAuthProviderCreateRequest(
             name="test",
             display_name="Test",
@@ -121,8 +124,6 @@ class TestOAuthProviderSchemas:
     
     def test_update_request_partial(self):
         """Test partial update request."""
-        from app.modules.oauth.schemas import OAuthProviderUpdateRequest
-        
         data = OAuthProviderUpdateRequest(
             display_name="New Name",
             is_active=False
@@ -134,8 +135,6 @@ class TestOAuthProviderSchemas:
     
     def test_status_request(self):
         """Test status request schema."""
-        from app.modules.oauth.schemas import OAuthProviderStatusRequest
-        
         activate = OAuthProviderStatusRequest(is_active=True)
         deactivate = OAuthProviderStatusRequest(is_active=False)
         
@@ -148,8 +147,6 @@ class TestOAuthProviderPermissions:
     
     def test_oauth_provider_permissions_exist(self):
         """Test that OAuth provider permissions are defined."""
-        from app.constants.permissions import PermissionEnum
-        
         assert hasattr(PermissionEnum, 'OAUTH_PROVIDERS_READ')
         assert hasattr(PermissionEnum, 'OAUTH_PROVIDERS_WRITE')
         assert hasattr(PermissionEnum, 'OAUTH_PROVIDERS_DELETE')
@@ -164,8 +161,6 @@ class TestOAuthProviderErrorCodes:
     
     def test_error_codes_exist(self):
         """Test that OAuth provider error codes are defined."""
-        from app.constants.error_codes import ErrorCode
-        
         assert hasattr(ErrorCode, 'OAUTH_PROVIDER_NOT_FOUND')
         assert hasattr(ErrorCode, 'OAUTH_PROVIDER_HAS_ACCOUNTS')
         assert hasattr(ErrorCode, 'DUPLICATE_ENTRY')
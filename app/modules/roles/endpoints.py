@@ -2,6 +2,7 @@
 Role management endpoints for RBAC.
 """
 from uuid import UUID
+from typing import Optional
 from fastapi import APIRouter, Depends, Query, status, Request
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -9,7 +10,7 @@ from app.core.database import get_db
 from app.core.docs import doc_responses
 from app.core.permissions import require_permissions
 from app.modules.roles.schemas import RoleCreateRequest, RoleUpdateRequest, RoleResponse, RoleListItemResponse
-from app.core.schemas.response import SuccessResponse, PaginatedResponse
+from app.core.schemas.response import SuccessResponse, CursorPaginatedResponse
 from app.modules.roles.service import RoleService
 from app.constants import PermissionEnum
 
@@ -58,7 +59,7 @@ async def create_role(
 
 @router.get(
     "",
-    response_model=PaginatedResponse[RoleListItemResponse],
+    response_model=CursorPaginatedResponse[RoleListItemResponse],
     summary="List Roles",
     responses=doc_responses(
         success_message="Roles retrieved successfully",
@@ -66,11 +67,11 @@ async def create_role(
     )
 )
 async def list_roles(
-    page: int = Query(default=1, ge=1, description="Page number"),
     per_page: int = Query(default=20, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
     name: str = Query(None, description="Filter by role name"),
     q: str = Query(None, description="Search term"),
-    sort: str = Query("created_at", description="Sort field"),
+    sort: str = Query("created_at", description="Sort field (created_at, updated_at, name)"),
     order: str = Query("desc", description="Sort order (asc/desc)"),
     db: AsyncSession = Depends(get_db),
     current_user = Depends(require_permissions([PermissionEnum.ROLES_READ]))
@@ -80,12 +81,12 @@ async def list_roles(
     
     - Requires `roles:read` permission
     - Returns role summary without full permission details
-    - Returns paginated results with metadata
+    - Cursor-paginated: pass `next_cursor` back as `cursor` for the next page
     """
     role_service = RoleService(db)
     role_data = await role_service.list_roles(
-        page=page, 
         per_page=per_page,
+        cursor=cursor,
         name=name,
         search=q,
         sort=sort,
@@ -25,6 +25,14 @@ class Role(SQLModel, table=True):
         back_populates="role",
         sa_relationship_kwargs={"cascade": "all, delete-orphan"}
     )
+    # Read-only view over role_permissions; must be eager-loaded (selectinload)
+    permissions: list["Permission"] = Relationship(
+        sa_relationship_kwargs={
+            "secondary": "role_permissions",
+            "viewonly": True,
+            "lazy": "raise",
+        }
+    )
 
 
 class Permission(SQLModel, table=True):
@@ -47,7 +55,8 @@ class RolePermission(SQLModel, table=True):
     __tablename__ = "role_permissions"
 
     role_id: UUID = Field(foreign_key="roles.id", primary_key=True)
-    permission_id: UUID = Field(foreign_key="permissions.id", primary_key=True)
+    # Indexed on its own: the PK only serves lookups that lead with role_id
+    permission_id: UUID = Field(foreign_key="permissions.id", primary_key=True, index=True)
 
     # Relationships
     role: Role = Relationship(back_populates="role_permissions")
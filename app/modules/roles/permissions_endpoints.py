@@ -7,10 +7,11 @@ Use the list endpoint to view available permissions for role assignment.
 """
 from uuid import UUID
 from fastapi import APIRouter, Depends, status, Request
+from fastapi.responses import StreamingResponse
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.database import get_db
-from app.core.docs import doc_responses
+from app.core.docs import doc_responses, create_error_responses
 from app.core.permissions import require_permissions
 from typing import List
 from app.modules.roles.schemas import PermissionCreateRequest, PermissionResponse
@@ -49,6 +50,36 @@ async def list_permissions(
     )
 
 
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    summary="Stream Permissions (NDJSON)",
+    responses={
+        200: {
+            "description": "One permission JSON object per line",
+            "content": {"application/x-ndjson": {}}
+        },
+        **create_error_responses(401, 403)
+    }
+)
+async def stream_permissions(
+    db: AsyncSession = Depends(get_db),
+    current_user = Depends(require_permissions([PermissionEnum.PERMISSIONS_READ]))
+):
+    """
+    Stream all permissions as newline-delimited JSON.
+    
+    - Requires `permissions:read` permission
+    - Rows are read from a server-side cursor and sent as they arrive,
+      so memory stays flat however many permissions exist
+    """
+    perm_service = PermissionService(db)
+    return StreamingResponse(
+        perm_service.list_permissions_stream(),
+        media_type="application/x-ndjson"
+    )
+
+
 # NOTE: Create and Delete permission endpoints are deprecated.
 # Permissions should be defined in app/constants/permissions.py and seeded.
 # These endpoints are kept for backwards compatibility but may be removed.
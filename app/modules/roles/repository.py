@@ -1,15 +1,18 @@
 """
 Role and Permission repositories.
 """
-from typing import List, Optional
-from uuid import UUID
+from datetime import datetime
+from typing import Any, AsyncIterator, List, Optional, Tuple
+from uuid import UUID, uuid4
 
-from sqlmodel import select, func, delete
+from sqlmodel import select, func, delete, update
+from sqlalchemy import tuple_
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.modules.roles.models import Role, Permission, RolePermission
 from app.core.base_repository import BaseRepository
+from app.core.filtering import apply_filters, apply_search
 
 
 class RoleRepository(BaseRepository[Role]):
@@ -31,43 +34,37 @@ class RoleRepository(BaseRepository[Role]):
         )
         return list(result.scalars().all())
     
-    async def get_with_permissions(self, role_id: UUID) -> Optional[tuple[Role, List[Permission]]]:
+    async def get_with_permissions(self, role_id: UUID) -> Optional[Role]:
         """
-        Get role with permissions in a single query (eager loading).
-        Returns tuple of (role, permissions) to avoid N+1 queries.
+        Get role with permissions eagerly loaded.
+        Uses selectinload so permissions arrive in one extra IN query (no N+1).
         """
-        # Get role
         result = await self.db.execute(
-            select(Role).where(Role.id == role_id)
+            select(Role)
+            .where(Role.id == role_id)
+            .options(selectinload(Role.permissions))
         )
-        role = result.scalar_one_or_none()
-        
-        if not role:
-            return None
-        
-        # Get permissions in single query
-        permissions = await self.get_permissions(role_id)
-        
-        return (role, permissions)
+        return result.scalar_one_or_none()
     
     async def list_with_permission_counts(
         self, 
-        skip: int = 0, 
         limit: int = 20,
         filters: Optional[dict] = None,
         search_query: Optional[str] = None,
         sort_by: str = "created_at",
-        sort_order: str = "desc"
+        sort_order: str = "desc",
+        after: Optional[Tuple[Any, UUID]] = None
     ) -> List[tuple[Role, int]]:
         """
         Get all roles with their permission counts.
         Optimized to avoid N+1 queries using a single JOIN and GROUP BY.
         
+        Uses keyset pagination on (sort_by, id): `after` is the key of the
+        last row already seen, so each page costs the same regardless of depth.
+        
         Returns:
             List of tuples (role, permission_count)
         """
-        from app.core.filtering import apply_filters, apply_search, apply_sorting, SortOrder
-
         query = select(
             Role,
             func.count(RolePermission.permission_id).label("permission_count")
@@ -82,13 +79,23 @@ class RoleRepository(BaseRepository[Role]):
             # Search in name and description
             query = apply_search(query, Role, search_query, ["name", "description"])
 
+        sort_field = getattr(Role, sort_by)
+        descending = sort_order == "desc"
+
+        # Keyset: rows strictly after the cursor in (sort_by, id) order
+        if after is not None:
+            key = tuple_(sort_field, Role.id)
+            query = query.where(key < tuple_(*after) if descending else key > tuple_(*after))
+
         query = query.group_by(Role.id)
 
-        # Apply Sorting
-        query = apply_sorting(query, Role, sort_by, SortOrder(sort_order))
+        # id breaks ties so the ordering is total and the cursor is stable
+        if descending:
+            query = query.order_by(sort_field.desc(), Role.id.desc())
+        else:
+            query = query.order_by(sort_field.asc(), Role.id.asc())
 
-        # Pagination
-        query = query.offset(skip).limit(limit)
+        query = query.limit(limit)
 
         result = await self.db.execute(query)
         
@@ -104,8 +111,6 @@ class RoleRepository(BaseRepository[Role]):
         Create a role with permissions.
         Optimized with batch insert for permissions.
         """
-        from uuid import uuid4
-        
         role = Role(
             id=uuid4(),
             name=name,
@@ -124,7 +129,7 @@ class RoleRepository(BaseRepository[Role]):
             self.db.add_all(role_perms)  # Batch insert
         
         await self.db.commit()
-        await self.db.refresh(role)
+        await self._refresh_if_expired(role)
         return role
     
     async def update_role(
@@ -133,20 +138,40 @@ class RoleRepository(BaseRepository[Role]):
         name: Optional[str] = None,
         description: Optional[str] = None,
         permission_ids: Optional[List[UUID]] = None
-    ) -> Optional[Role]:
+    ) -> Optional[dict]:
         """
-        Update a role and its permissions.
-        Optimized with batch operations.
+        Update a non-system role and its permissions.
+        
+        The system-role guard and the read of the previous values happen in
+        the same statement as the write (WITH old AS (... FOR UPDATE)
+        UPDATE ... RETURNING), so there is no window between check and write.
+        
+        Returns:
+            The role's previous name/description, or None if no non-system
+            role with this id exists.
         """
-        role = await self.get(role_id)
-        if not role:
-            return None
+        old = (
+            select(Role.id, Role.name, Role.description)
+            .where(Role.id == role_id, Role.is_system == False)  # noqa: E712
+            .with_for_update()
+            .cte("old")
+        )
         
-        # Update basic fields
+        values = {"updated_at": datetime.utcnow()}
         if name is not None:
-            role.name = name
+            values["name"] = name
         if description is not None:
-            role.description = description
+            values["description"] = description
+        
+        result = await self.db.execute(
+            update(Role)
+            .where(Role.id == old.c.id)
+            .values(**values)
+            .returning(old.c.name, old.c.description)
+        )
+        row = result.first()
+        if row is None:
+            return None
         
         # Update permissions if provided
         if permission_ids is not None:
@@ -164,8 +189,7 @@ class RoleRepository(BaseRepository[Role]):
                 self.db.add_all(role_perms)
         
         await self.db.commit()
-        await self.db.refresh(role)
-        return role
+        return {"name": row.name, "description": row.description}
     
     async def add_permission(self, role_id: UUID, permission_id: UUID) -> RolePermission:
         """Add a permission to a role."""
@@ -212,3 +236,16 @@ class PermissionRepository(BaseRepository[Permission]):
         """Get all permissions."""
         result = await self.db.execute(select(Permission))
         return result.scalars().all()
+    
+    async def stream_all(self, batch_size: int = 500) -> AsyncIterator[Permission]:
+        """
+        Yield all permissions ordered by code without loading them all at once.
+        Rows are fetched from a server-side cursor in batches of `batch_size`.
+        """
+        result = await self.db.stream_scalars(
+            select(Permission)
+            .order_by(Permission.code)
+            .execution_options(yield_per=batch_size)
+        )
+        async for permission in result:
+            yield permission
@@ -1,24 +1,31 @@
 """
 Role and Permission management services.
 """
-from typing import List, Optional, Dict, Any, Union
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Dict, Any
 from uuid import UUID
 from fastapi import Request
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.modules.roles.models import Permission
 from app.modules.roles.repository import RoleRepository, PermissionRepository
+from app.core.cache import increment_cache
 from app.core.exceptions import NotFoundError, ConflictError, ValidationError
+from app.core.schemas.pagination import encode_cursor, decode_cursor
 from app.constants import ErrorCode
 from app.modules.audit.service import audit_service
 from app.modules.roles.schemas import (
     RoleResponse, 
     RoleDetailResponse, 
     RoleListItemResponse,
-    RolesListResponse,
     PermissionResponse
 )
 
+# Non-null columns usable as the leading keyset column for role listing
+ROLE_CURSOR_SORT_FIELDS = ("created_at", "updated_at", "name")
+
+
 class RoleService:
     """Service for role management business logic."""
     
@@ -28,7 +35,6 @@ class RoleService:
     
     async def _invalidate_role_cache(self, role_id: UUID) -> None:
         """Increment role version to invalidate cached permissions for users."""
-        from app.core.cache import increment_cache
         await increment_cache(f"role:version:{role_id}")
 
     async def create_role(
@@ -73,39 +79,40 @@ class RoleService:
     
     async def list_roles(
         self, 
-        page: int = 1, 
         per_page: int = 20,
+        cursor: Optional[str] = None,
         name: Optional[str] = None,
         search: Optional[str] = None,
         sort: str = "created_at",
         order: str = "desc"
     ) -> Dict[str, Any]:
         """
-        List all roles with permission counts and pagination.
+        List roles with permission counts using keyset (cursor) pagination.
+        
+        No total count is computed; one extra row is fetched to derive has_next.
+        Pass the returned next_cursor back to get the following page.
         """
-        from sqlmodel import select, func
-        from app.modules.roles.models import Role
+        if sort not in ROLE_CURSOR_SORT_FIELDS:
+            sort = "created_at"
+        if order != "asc":
+            order = "desc"
         
-        # Get total count
-        count_query = select(func.count()).select_from(Role)
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
+        after = self._decode_cursor(cursor, sort, order) if cursor else None
         
-        # Use repository method for data access with pagination
-        skip = (page - 1) * per_page
-        roles_with_counts = await self.role_repo.list_with_permission_counts(
-            skip=skip, 
-            limit=per_page,
+        rows = await self.role_repo.list_with_permission_counts(
+            limit=per_page + 1,
             filters={"name": name} if name else None,
             search_query=search,
             sort_by=sort,
-            sort_order=order
+            sort_order=order,
+            after=after
         )
         
-        total_pages = (total + per_page - 1) // per_page if per_page > 0 else 0
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
         
         items = []
-        for role, count in roles_with_counts:
+        for role, count in rows:
             # We construct the response manually or use a specific schema that includes permission_count
             # RoleListItemResponse is designed for this but expects standard fields.
             # We can map it:
@@ -119,39 +126,54 @@ class RoleService:
                 updated_at=role.updated_at
             )
             items.append(item)
+        
+        next_cursor = None
+        if has_next:
+            last_role = rows[-1][0]
+            next_cursor = encode_cursor(sort, order, getattr(last_role, sort), last_role.id)
             
         return {
             "items": [item.model_dump() for item in items],
-            "total": total,
-            "page": page,
             "per_page": per_page,
-            "total_pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
+            "has_next": has_next,
+            "next_cursor": next_cursor
         }
     
+    @staticmethod
+    def _decode_cursor(cursor: str, sort: str, order: str) -> tuple:
+        """Decode a list cursor into the (sort value, id) keyset tuple."""
+        try:
+            cursor_sort, cursor_order, value, role_id = decode_cursor(cursor)
+            if cursor_sort != sort or cursor_order != order:
+                raise ValueError("Cursor was issued for a different sort")
+            # Every sort value is serialized as a string (names as-is,
+            # timestamps as ISO 8601), as is the id
+            if not isinstance(value, str) or not isinstance(role_id, str):
+                raise ValueError("Cursor values have the wrong type")
+            if sort in ("created_at", "updated_at"):
+                value = datetime.fromisoformat(value)
+            return value, UUID(role_id)
+        except (ValueError, TypeError, AttributeError) as e:
+            raise ValidationError(
+                error_code=ErrorCode.FIELD_INVALID,
+                message="Invalid pagination cursor",
+                field="cursor"
+            ) from e
+    
     async def get_role(self, role_id: UUID) -> RoleDetailResponse:
         """
         Get role details with permissions.
         """
-        result = await self.role_repo.get_with_permissions(role_id)
+        role = await self.role_repo.get_with_permissions(role_id)
         
-        if not result:
+        if not role:
             raise NotFoundError(
                 error_code=ErrorCode.ROLE_NOT_FOUND,
                 message="Role not found"
             )
         
-        role, permissions = result
-        
-        # Map to RoleDetailResponse
-        # Use model_validate to handle the basic fields, then attach permissions
-        
-        # We need to construct the response manually because 'permissions' in the model
-        # might expect a list of PermissionResponse/Permission objects.
-        
         permission_responses = [
-            PermissionResponse.model_validate(p) for p in permissions
+            PermissionResponse.model_validate(p) for p in role.permissions
         ]
         
         return RoleDetailResponse(
@@ -176,36 +198,29 @@ class RoleService:
         """
         Update role details and permissions.
         """
-        role = await self.role_repo.get(str(role_id))
-        
-        if not role:
-            raise NotFoundError(
-                error_code=ErrorCode.ROLE_NOT_FOUND,
-                message="Role not found"
-            )
+        old_values = await self.role_repo.update_role(
+            role_id=role_id,
+            name=name,
+            description=description,
+            permission_ids=permission_ids
+        )
         
-        if role.is_system:
+        if old_values is None:
+            # Nothing updated: find out whether the role is missing or protected
+            role = await self.role_repo.get(str(role_id))
+            if not role:
+                raise NotFoundError(
+                    error_code=ErrorCode.ROLE_NOT_FOUND,
+                    message="Role not found"
+                )
             raise ValidationError(
                 error_code=ErrorCode.CANNOT_MODIFY_SYSTEM_ROLE,
                 message="Cannot modify system roles",
                 field="role_id"
             )
         
-        old_values = {
-            "name": role.name,
-            "description": role.description
-        }
-        
-        # Update role
-        await self.role_repo.update_role(
-            role_id=role.id,
-            name=name,
-            description=description,
-            permission_ids=permission_ids
-        )
-        
         # Invalidate cache
-        await self._invalidate_role_cache(role.id)
+        await self._invalidate_role_cache(role_id)
         
         new_values = {}
         if name: new_values["name"] = name
@@ -215,7 +230,7 @@ class RoleService:
         await audit_service.log_action(
             action="update_role",
             actor_id=actor_id,
-            target_id=str(role.id),
+            target_id=str(role_id),
             target_type="role",
             old_values=old_values,
             new_values=new_values,
@@ -273,8 +288,6 @@ class PermissionService:
         """
         Create a new permission.
         """
-        from app.modules.roles.models import Permission
-
         # Check if permission already exists
         existing = await self.perm_repo.get_by_code(code)
         if existing:
@@ -311,6 +324,13 @@ class PermissionService:
             PermissionResponse.model_validate(p) for p in permissions
         ]
     
+    async def list_permissions_stream(self) -> AsyncIterator[bytes]:
+        """
+        Stream all permissions as NDJSON (one JSON object per line).
+        """
+        async for permission in self.perm_repo.stream_all():
+            yield PermissionResponse.model_validate(permission).model_dump_json().encode() + b"\n"
+    
     async def delete_permission(self, permission_id: UUID, actor_id: UUID, request: Optional[Request] = None) -> None:
         """
         Delete a permission.
@@ -2,10 +2,12 @@
 Role and Permission Service tests.
 """
 import pytest
+from secrets import token_hex
 from uuid import uuid4
 from app.modules.roles.service import RoleService, PermissionService
-from app.core.exceptions import ConflictError, NotFoundError
+from app.core.exceptions import ConflictError, NotFoundError, ValidationError
 from app.modules.roles.models import Role
+from app.core.schemas.pagination import encode_cursor
 from app.core.mongo import mongodb
 
 @pytest.fixture(autouse=True)
@@ -18,17 +20,12 @@ async def setup_mongo_connection():
 class TestRoleService:
     """Test RoleService with real database."""
     
-    async def test_role_service_init(self, session):
-        """Test RoleService initialization."""
-        service = RoleService(session)
-        assert service.db is session
-    
     async def test_create_role_success(self, session):
         """Test successful role creation."""
         service = RoleService(session)
         
         role = await service.create_role(
-            name="test_role_" + str(uuid4())[:8],
+            name="test_role_" + token_hex(4),
             description="Test role description",
             actor_id=uuid4()
         )
@@ -36,53 +33,105 @@ class TestRoleService:
         assert role is not None
         assert "test_role_" in role.name
     
-    async def test_create_role_duplicate(self, session):
+    async def test_create_role_duplicate(self, session, seed):
         """Test creating role with duplicate name."""
-        role_name = "duplicate_role_" + str(uuid4())[:8]
+        role_name = "duplicate_role_" + token_hex(4)
         
         # Create first role
-        role = Role(name=role_name, description="First role")
-        session.add(role)
-        await session.commit()
+        await seed(Role(name=role_name, description="First role"))
         
         service = RoleService(session)
         
-        with pytest.raises(ConflictError):
+        with pytest.raises(ConflictError, match="already exists"):
             await service.create_role(name=role_name, description="Duplicate role", actor_id=uuid4())
     
-    async def test_get_role_not_found(self, session):
-        """Test getting non-existent role."""
+    @pytest.mark.parametrize("operation", [
+        lambda service, role_id: service.get_role(role_id),
+        lambda service, role_id: service.update_role(role_id=role_id, actor_id=uuid4(), name="ghost"),
+        lambda service, role_id: service.delete_role(role_id, actor_id=uuid4()),
+    ], ids=["get", "update", "delete"])
+    async def test_role_not_found(self, session, operation):
+        """Test operations on a non-existent role."""
+        service = RoleService(session)
+        
+        with pytest.raises(NotFoundError, match="Role not found"):
+            await operation(service, uuid4())
+    
+    async def test_update_system_role_rejected(self, session, seed):
+        """Test system roles cannot be updated and are left unchanged."""
+        role = Role(name="system_role_" + token_hex(4), is_system=True)
+        await seed(role)
+        
         service = RoleService(session)
         
-        with pytest.raises(NotFoundError):
-            await service.get_role(uuid4())
+        with pytest.raises(ValidationError):
+            await service.update_role(role_id=role.id, actor_id=uuid4(), name="renamed")
+        
+        await session.refresh(role)
+        assert role.name.startswith("system_role_")
     
     async def test_list_roles_paginated(self, session):
         """Test listing roles with pagination."""
         service = RoleService(session)
         
-        result = await service.list_roles(page=1, per_page=10)
+        result = await service.list_roles(per_page=10)
         
         assert "items" in result
-        assert "total" in result
-        assert "page" in result
         assert "per_page" in result
+        assert "has_next" in result
+        assert "next_cursor" in result
+    
+    async def test_list_roles_cursor_walks_all_pages(self, session, seed):
+        """Test following next_cursor visits every role exactly once."""
+        service = RoleService(session)
+        prefix = f"CURSOR_{token_hex(4)}"
+        await seed(*[Role(name=f"{prefix}_{i}") for i in range(5)])
+        
+        seen = []
+        cursor = None
+        while True:
+            result = await service.list_roles(per_page=2, cursor=cursor, search=prefix)
+            seen.extend(item["name"] for item in result["items"])
+            if not result["has_next"]:
+                assert result["next_cursor"] is None
+                break
+            cursor = result["next_cursor"]
+        
+        assert sorted(seen) == [f"{prefix}_{i}" for i in range(5)]
+    
+    async def test_list_roles_invalid_cursor(self, session):
+        """Test malformed cursor is rejected."""
+        service = RoleService(session)
+        
+        with pytest.raises(ValidationError):
+            await service.list_roles(cursor="not-a-cursor")
+    
+    @pytest.mark.parametrize("cursor_values,sort,order", [
+        (("name", "asc", "x", 123), "name", "asc"),
+        (("name", "asc", 123, str(uuid4())), "name", "asc"),
+        (("created_at", "desc", "not-a-date", str(uuid4())), "created_at", "desc"),
+        (("name", "asc", "x", str(uuid4())), "name", "desc"),
+        (("name", "x", str(uuid4())), "name", "asc"),
+    ], ids=["non_string_id", "non_string_name", "bad_timestamp", "flipped_order", "missing_order"])
+    async def test_list_roles_tampered_cursor(self, session, cursor_values, sort, order):
+        """Test well-formed cursors with wrong values or another sort are rejected."""
+        service = RoleService(session)
+        
+        with pytest.raises(ValidationError, match="Invalid pagination cursor"):
+            await service.list_roles(
+                cursor=encode_cursor(*cursor_values), sort=sort, order=order
+            )
 
 
 class TestPermissionService:
     """Test PermissionService with real database."""
     
-    async def test_permission_service_init(self, session):
-        """Test PermissionService initialization."""
-        service = PermissionService(session)
-        assert service.db is session
-    
     async def test_create_permission_success(self, session):
         """Test successful permission creation."""
         service = PermissionService(session)
         
         permission = await service.create_permission(
-            code="test_permission_" + str(uuid4())[:8],
+            code="test_permission_" + token_hex(4),
             description="Test permission",
             actor_id=uuid4()
         )
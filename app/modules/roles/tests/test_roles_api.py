@@ -5,116 +5,69 @@ Run with: pytest tests/test_roles.py -v
 import pytest
 import uuid
 from datetime import datetime
-from unittest.mock import AsyncMock, patch, MagicMock
-from app.modules.users.models import User
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
 from app.modules.roles.models import Role, Permission
-from app.constants.enums import UserType
-from app.core.security import create_access_token
-
-
-@pytest.fixture
-def mock_admin_user():
-    """Create a mock admin user with all permissions."""
-    user = MagicMock(spec=User)
-    user.id = uuid.uuid4()
-    user.email = "admin@example.com"
-    user.user_type = UserType.ADMIN
-    user.is_active = True
-    user.is_verified = True
-    return user
-
-
-@pytest.fixture
-def admin_token(mock_admin_user):
-    """Create a valid access token for the admin user."""
-    return create_access_token(subject=str(mock_admin_user.id))
+from app.modules.roles import endpoints as role_endpoints
+from app.modules.roles.schemas import RoleResponse
+from app.modules.roles.service import RoleService
+from app.main import app
+from app.core import permissions
+from app.core.permissions import require_permissions, get_current_user
+from app.constants import PermissionEnum
+from app.core.database import get_db
+
+# Never parsed by the unauthorized tests, so a fixed value is enough
+FAKE_UUID = "00000000-0000-0000-0000-000000000000"
+
+
+@pytest.fixture(scope="module")
+def shared_role_service() -> AsyncMock:
+    """
+    A mock RoleService built once per module.
+    
+    Specced on RoleService so a typo'd or removed method fails the test
+    instead of returning an auto-created child mock.
+    """
+    return AsyncMock(spec=RoleService)
 
 
 @pytest.fixture
-async def override_get_current_user(app, mock_admin_user):
-    """Override the get_current_user dependency."""
-    from app.api.deps import get_current_user
-    app.dependency_overrides[get_current_user] = lambda: mock_admin_user
-    yield
-    app.dependency_overrides = {}
+def mock_role_service(monkeypatch, shared_role_service):
+    """Make the role endpoints build this mock instead of a real RoleService."""
+    shared_role_service.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr(role_endpoints, "RoleService", lambda db: shared_role_service)
+    return shared_role_service
 
 
 @pytest.fixture
-async def override_require_permissions(app, mock_admin_user):
-    """Override permission check."""
-    # We patch the dependency that checks permissions
-    # Note: This is tricky because require_permissions returns a callable
-    # Easier to mock the dependency resolution in the router test or bypass auth
-    pass
+def all_permissions(monkeypatch):
+    """Grant every permission to whichever user the request resolves to."""
+    monkeypatch.setattr(permissions, "get_user_permissions", AsyncMock(return_value=["*"]))
 
 
 class TestRolesEndpointUnauthorized:
-    """Test role endpoints without authentication."""
-    
-    async def test_list_roles_unauthorized(self, client):
-        """Test listing roles without authentication."""
-        response = await client.get("/api/v1/admin/roles")
-        assert response.status_code == 401
-    
-    async def test_create_role_unauthorized(self, client):
-        """Test creating role without authentication."""
-        response = await client.post(
-            "/api/v1/admin/roles",
-            json={"name": "TEST_ROLE", "description": "Test"}
-        )
-        assert response.status_code == 401
-    
-    async def test_get_role_unauthorized(self, client):
-        """Test getting role without authentication."""
-        fake_id = str(uuid.uuid4())
-        response = await client.get(f"/api/v1/admin/roles/{fake_id}")
-        assert response.status_code == 401
-    
-    async def test_update_role_unauthorized(self, client):
-        """Test updating role without authentication."""
-        fake_id = str(uuid.uuid4())
-        response = await client.put(
-            f"/api/v1/admin/roles/{fake_id}",
-            json={"name": "UPDATED_ROLE"}
-        )
-        assert response.status_code == 401
+    """Test role and permission endpoints without authentication."""
     
-    async def test_delete_role_unauthorized(self, client):
-        """Test deleting role without authentication."""
-        fake_id = str(uuid.uuid4())
-        response = await client.delete(f"/api/v1/admin/roles/{fake_id}")
-        assert response.status_code == 401
-
-
-class TestPermissionsEndpointUnauthorized:
-    """Test permission endpoints without authentication."""
-    
-    async def test_list_permissions_unauthorized(self, client):
-        """Test listing permissions without authentication."""
-        response = await client.get("/api/v1/admin/permissions")
-        assert response.status_code == 401
-
-
-class TestRoleValidation:
-    """Test role endpoint validation (auth is checked before path validation)."""
-    
-    async def test_get_role_invalid_uuid(self, client):
-        """Test getting role with invalid UUID returns 401 first (auth check)."""
-        response = await client.get("/api/v1/admin/roles/not-a-uuid")
-        # Auth is checked before path validation
-        assert response.status_code == 401
-    
-    async def test_update_role_invalid_uuid(self, client):
-        """Test updating role with invalid UUID returns 401 first."""
-        response = await client.put(
-            "/api/v1/admin/roles/not-a-uuid",
-            json={"description": "TEST"}
-        )
-        assert response.status_code == 401
-    
-    async def test_delete_role_invalid_uuid(self, client):
-        """Test deleting role with invalid UUID returns 401 first."""
-        response = await client.delete("/api/v1/admin/roles/not-a-uuid")
+    # Auth is checked before path validation, so invalid UUIDs also get 401
+    @pytest.mark.parametrize("method,url,json", [
+        ("GET", "/api/v1/admin/roles", None),
+        ("POST", "/api/v1/admin/roles", {"name": "TEST_ROLE", "description": "Test"}),
+        ("GET", f"/api/v1/admin/roles/{FAKE_UUID}", None),
+        ("PUT", f"/api/v1/admin/roles/{FAKE_UUID}", {"name": "UPDATED_ROLE"}),
+        ("DELETE", f"/api/v1/admin/roles/{FAKE_UUID}", None),
+        ("GET", "/api/v1/admin/permissions", None),
+        ("GET", "/api/v1/admin/roles/not-a-uuid", None),
+        ("PUT", "/api/v1/admin/roles/not-a-uuid", {"description": "TEST"}),
+        ("DELETE", "/api/v1/admin/roles/not-a-uuid", None),
+    ], ids=[
+        "list_roles", "create_role", "get_role", "update_role", "delete_role",
+        "list_permissions", "get_role_invalid_uuid", "update_role_invalid_uuid",
+        "delete_role_invalid_uuid"
+    ])
+    async def test_admin_endpoint_unauthorized(self, client, method, url, json):
+        """Test admin endpoints reject requests without authentication."""
+        response = await client.request(method, url, json=json)
         assert response.status_code == 401
 
 
@@ -125,7 +78,7 @@ class TestRoleHappyPath:
         """Test successful role creation."""
         # 1. Mock dependencies
         mock_role_service = AsyncMock()
-        mock_role_service.create_role.return_value = MagicMock(
+        mock_role_service.create_role.return_value = SimpleNamespace(
             id=uuid.uuid4(), 
             name="NEW_ROLE", 
             description="Desc", 
@@ -137,7 +90,6 @@ class TestRoleHappyPath:
         # or compatible for SuccessResponse. The RoleService refactor returns a RoleResponse object.
         # But wait, create_role endpoint dumps it?
         # Let's mock the return value as the exact expected structure
-        from app.modules.roles.schemas import RoleResponse
         mock_resp = RoleResponse(
             id=uuid.uuid4(), 
             name="NEW_ROLE", 
@@ -149,7 +101,7 @@ class TestRoleHappyPath:
         mock_role_service.create_role.return_value = mock_resp
 
         # Patch the RoleService class to return our mock instance
-        with patch("app.modules.roles.endpoints.RoleService", return_value=mock_role_service):
+        with patch.object(role_endpoints, "RoleService", return_value=mock_role_service):
             # Patch permission checker to allow access
             # This is complex due to Depends.
             # Simplified approach: Patch the dependency override
@@ -172,134 +124,64 @@ class TestRoleHappyPath:
     
     # Let's write a targeted test using dependency overrides which is standard FastAPI testing.
 
-    async def test_create_role_authorized_mocked(self, client):
+    async def test_create_role_authorized_mocked(self, client, mock_role_service, all_permissions):
         """
         Test create role with mocked service and authorized user.
         Using client fixture.
         """
-        # We need to import the app to set overrides
-        from app.main import app
-        from app.core.permissions import require_permissions
-        from app.constants import PermissionEnum
-        
         # Mock user
-        mock_user = MagicMock()
-        mock_user.id = uuid.uuid4()
-        
-        # Mock RoleService and override dependencies
-        with patch("app.modules.roles.endpoints.RoleService") as MockService:
-            service_instance = MockService.return_value
-            from app.modules.roles.schemas import RoleResponse
-            
-            expected_role = RoleResponse(
-                id=uuid.uuid4(), 
-                name="TEST_ROLE",
-                description="Test Description",
-                is_system=False,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow()
-            )
-            service_instance.create_role = AsyncMock(return_value=expected_role)
+        mock_user = SimpleNamespace(id=uuid.uuid4(), is_active=True, is_verified=True)
+        app.dependency_overrides[get_current_user] = lambda: mock_user
 
-            # We need to bypass the permission check.
-            # Best way is to dependency override the specific permission check.
-            # But the require_permissions returns a callable dependency.
-            # We can just override `get_current_user` to return a user, and hope the permission check logic 
-            # (which we mock or the user has permissions) works.
-            
-            # Let's override the `require_permissions` result if possible but it's a factory.
-            # Instead, let's override `get_db` and `get_current_user`.
-            from app.core.database import get_db
-            from app.core.permissions import get_current_user
-            
-            app.dependency_overrides[get_current_user] = lambda: mock_user
-            
-            # We also need to mock the validator that checks if user has permission
-            # However, require_permissions is a class or callable that creates a dependency.
-            # If we cannot easily override it, we can create a user that satisfies it (if logic is real) 
-            # OR we mock the PermissionChecker class.
-            
-            # For now, let's try to just hit the endpoint. If it returns 403, we know auth part is hit.
-            # Only if we mock the permission layer to return True does it work.
-            
-            # Let's try to just assume the permission check passes if we don't know how to mock it easily 
-            # without inspecting core code deeper. But to make the test pass, let's skip the 
-            # actual valid call if we can't easily mock auth, and instead assert we can mock the Service 
-            # if we COULD auth.
-            
-            # Actually, `client` in `test_roles.py` likely points to `app`.
-            # We can use `app.dependency_overrides`.
-            
-            # To bypass permissions, we can override the dependency that `require_permissions` returns.
-            # But `require_permissions` is called at decorator time. 
-            # The dependency is `Requirement(permissions=[...])`.
-            
-            # Let's simplify: Test create role WITHOUT full integration if complex auth. 
-            # Just relying on `test_create_role_success` (which I added above that uses `client`) works? 
-            # Wait, `test_create_role_success` above uses `client` but doesn't do a request? 
-            # Ah, I see `test_create_role_success` in previous file content DOES NOT make a request.
-            # It just mocked things and passed.
-            
-            # I will implement a proper test that makes a request.
-            
-            # Patch get_user_permissions to always return all permissions
-            with patch("app.core.permissions.get_user_permissions", new_callable=AsyncMock) as mock_get_perms:
-                mock_get_perms.return_value = ["*"]
-                
-                # Make the request
-                response = await client.post(
-                    "/api/v1/admin/roles",
-                    json={"name": "TEST_ROLE", "description": "Test Description"}
-                )
-                
-                # Assertions
-                assert response.status_code == 201
-                data = response.json()
-                assert data["success"] is True
-                assert data["data"]["name"] == "TEST_ROLE"
+        expected_role = RoleResponse(
+            id=uuid.uuid4(), 
+            name="TEST_ROLE",
+            description="Test Description",
+            is_system=False,
+            created_at=datetime.utcnow(),
+            updated_at=datetime.utcnow()
+        )
+        mock_role_service.create_role.return_value = expected_role
 
-    async def test_list_roles_filtering(self, client):
+        # Make the request
+        response = await client.post(
+            "/api/v1/admin/roles",
+            json={"name": "TEST_ROLE", "description": "Test Description"}
+        )
+        
+        # Assertions
+        assert response.status_code == 201
+        data = response.json()
+        assert data["success"] is True
+        assert data["data"]["name"] == "TEST_ROLE"
+
+    async def test_list_roles_filtering(self, client, mock_role_service, all_permissions):
         """Test listing roles with filters passes params to service."""
         # Mock dependencies
-        mock_user = MagicMock()
-        mock_user.id = uuid.uuid4()
-        
-        from app.core.database import get_db
-        from app.core.permissions import get_current_user
-        from app.main import app
+        mock_user = SimpleNamespace(id=uuid.uuid4(), is_active=True, is_verified=True)
         
         # Override auth
         app.dependency_overrides[get_current_user] = lambda: mock_user
         
-        # Patch Service and Permissions
-        with patch("app.modules.roles.endpoints.RoleService") as MockService, \
-             patch("app.core.permissions.get_user_permissions", new_callable=AsyncMock) as mock_get_perms:
-            
-            # Grant permissions
-            mock_get_perms.return_value = ["*"]
-
-            service_instance = MockService.return_value
-            # Mock return value
-            service_instance.list_roles = AsyncMock(return_value={
-                "items": [], 
-                "total": 0, 
-                "page": 1, 
-                "per_page": 20
-            })
-            
-            # Make request with filters
-            response = await client.get(
-                "/api/v1/admin/roles?name=Manager&q=searchterm&sort=name&order=asc"
-            )
-            
-            assert response.status_code == 200
-            
-            # Verify parameters were passed - Use explicit keyword args in call check
-            service_instance.list_roles.assert_called_once()
-            call_kwargs = service_instance.list_roles.call_args.kwargs
-            
-            assert call_kwargs["name"] == "Manager"
-            assert call_kwargs["search"] == "searchterm"
-            assert call_kwargs["sort"] == "name"
-            assert call_kwargs["order"] == "asc"
-
+        mock_role_service.list_roles.return_value = {
+            "items": [], 
+            "per_page": 20,
+            "has_next": False,
+            "next_cursor": None
+        }
+        
+        # Make request with filters
+        response = await client.get(
+            "/api/v1/admin/roles?name=Manager&q=searchterm&sort=name&order=asc"
+        )
+        
+        assert response.status_code == 200
+        
+        # Verify parameters were passed - Use explicit keyword args in call check
+        mock_role_service.list_roles.assert_called_once()
+        call_kwargs = mock_role_service.list_roles.call_args.kwargs
+        
+        assert call_kwargs["name"] == "Manager"
+        assert call_kwargs["search"] == "searchterm"
+        assert call_kwargs["sort"] == "name"
+        assert call_kwargs["order"] == "asc"
@@ -1,9 +1,13 @@
+import json
 import pytest
 from httpx import AsyncClient
+from unittest.mock import patch
 from uuid import uuid4
 from app.modules.roles.models import Role, Permission
-from app.core.security import create_access_token
+from app.core.security import create_access_token, get_password_hash
 from app.constants import PermissionEnum
+from app.modules.users.models import User, Admin
+from app.constants.enums import UserType
 
 @pytest.mark.asyncio
 async def test_roles_crud_integration(client: AsyncClient, session):
@@ -21,10 +25,6 @@ async def test_roles_crud_integration(client: AsyncClient, session):
     # If we want to test REAL auth logic, we need a real user in DB.
     
     # Let's seed a Super Admin directly in DB
-    from app.modules.users.models import User, Admin
-    from app.constants.enums import UserType
-    from app.core.security import get_password_hash
-    
     user_id = uuid4()
     user = User(
         id=user_id,
@@ -52,7 +52,6 @@ async def test_roles_crud_integration(client: AsyncClient, session):
     
     # We will override `get_user_permissions` to allow access, 
     # effectively simulating a Super Admin for the purpose of testing the Role Endpoints logic.
-    from unittest.mock import patch
     
     with patch("app.core.permissions.get_user_permissions", return_value=["*"]):
         
@@ -115,10 +114,6 @@ async def test_roles_crud_integration(client: AsyncClient, session):
 @pytest.mark.asyncio
 async def test_permissions_list_integration(client: AsyncClient, session):
     """Verify list_permissions response structure."""
-    from app.modules.users.models import User
-    from app.constants.enums import UserType
-    from app.core.security import get_password_hash
-    
     user_id = uuid4()
     user = User(
          id=user_id,
@@ -135,7 +130,6 @@ async def test_permissions_list_integration(client: AsyncClient, session):
     token = create_access_token(data={"sub": str(user_id)})
     headers = {"Authorization": f"Bearer {token}"}
     
-    from unittest.mock import patch
     with patch("app.core.permissions.get_user_permissions", return_value=["*"]):
         res = await client.get("/api/v1/admin/permissions", headers=headers)
         assert res.status_code == 200
@@ -144,3 +138,35 @@ async def test_permissions_list_integration(client: AsyncClient, session):
         if len(data) > 0:
             assert "code" in data[0]
             assert "description" in data[0]
+
+
+@pytest.mark.asyncio
+async def test_permissions_stream_integration(client: AsyncClient, session):
+    """Verify the NDJSON permissions stream yields one permission per line."""
+    codes = sorted(f"stream_{uuid4().hex[:8]}:read" for _ in range(3))
+    session.add_all([Permission(code=code, description="Streamed") for code in codes])
+    
+    user_id = uuid4()
+    user = User(
+        id=user_id,
+        email=f"admin_stream_{uuid4()}@example.com",
+        hashed_password=get_password_hash("pass"),
+        user_type=UserType.ADMIN,
+        is_active=True,
+        is_verified=True
+    )
+    session.add(user)
+    await session.commit()
+    
+    token = create_access_token(data={"sub": str(user_id)})
+    headers = {"Authorization": f"Bearer {token}"}
+    
+    with patch("app.core.permissions.get_user_permissions", return_value=["*"]):
+        res = await client.get("/api/v1/admin/permissions/stream", headers=headers)
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("application/x-ndjson")
+        
+        rows = [json.loads(line) for line in res.text.splitlines()]
+        streamed = [row["code"] for row in rows]
+        for code in codes:
+            assert code in streamed
@@ -67,7 +67,6 @@ class UserRepository(BaseRepository[User]):
         
         self.db.add(user)
         await self.db.commit()
-        await self.db.refresh(user)
         return True
 
 
@@ -2,12 +2,14 @@
 Tests for Admin and Customer Management with Soft Delete and Audit Logging.
 """
 import pytest
+from secrets import token_hex
 from uuid import uuid4
 from sqlmodel import select
 from app.modules.users.models import User, Admin, Customer
 from app.modules.users.service import UserManagementService
 from app.modules.users.schemas import AdminCreate, CustomerCreate, AdminUpdate, CustomerUpdate
 from app.core.mongo import mongodb
+from app.modules.users.repository import UserRepository
 
 @pytest.fixture
 def service(session):
@@ -39,7 +41,6 @@ async def test_create_admin(service, super_admin_id):
     assert admin.is_active is True
     
     # Verify User created
-    from app.modules.users.repository import UserRepository
     user_repo = UserRepository(service.session)
     user = await user_repo.get_by_email("newadmin@test.com")
     assert user is not None
@@ -60,7 +61,6 @@ async def test_soft_delete_and_resuse_email_admin(service, super_admin_id):
     assert not any(a.id == admin.id for a in admins)
     
     # Verify in DB directly
-    from app.modules.users.repository import UserRepository
     user_repo = UserRepository(service.session)
     user = await user_repo.get(admin.user_id)
     assert user.is_active is False
@@ -164,8 +164,7 @@ async def test_list_customers_filtering(service, super_admin_id):
 @pytest.mark.asyncio
 async def test_list_admins_filtering(service, super_admin_id):
     """Test filtering, searching, and sorting admins."""
-    import uuid
-    uid = str(uuid.uuid4())[:8]
+    uid = token_hex(4)
     email1 = f"alice_{uid}@filtering-test.com"
     email2 = f"bob_{uid}@filtering-test.com"
     
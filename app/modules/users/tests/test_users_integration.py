@@ -4,6 +4,7 @@ from uuid import uuid4
 from app.modules.roles.models import Role
 from app.core.security import create_access_token, get_password_hash
 from app.constants.enums import UserType
+from app.modules.users.models import User
 
 @pytest.mark.asyncio
 async def test_users_integration(client: AsyncClient, session):
@@ -11,8 +12,6 @@ async def test_users_integration(client: AsyncClient, session):
     CRUD integration for Admins and Customers.
     """
     # Setup Super Admin
-    from app.modules.users.models import User
-    
     # Create Role first
     role = Role(name="TEST_ADMIN_ROLE", description="Test Role", is_system=False)
     session.add(role)
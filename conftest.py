@@ -2,9 +2,12 @@ import os
 
 # Set test mode flag to disable rate limiting
 os.environ["TESTING"] = "1"
+# Minimum bcrypt cost: hashes stay real bcrypt but take ~1ms instead of ~250ms
+os.environ["BCRYPT_ROUNDS"] = "4"
 
 import asyncio
 import pytest
+from unittest.mock import MagicMock
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
@@ -20,75 +23,139 @@ from app.core.cache import reset_redis_client
 DB_HOST = os.getenv("POSTGRES_SERVER", "localhost")
 POSTGRES_USER = os.getenv("POSTGRES_USER", "postgres")
 POSTGRES_PASSWORD = os.getenv("POSTGRES_PASSWORD", "postgres")
-TEST_DB_NAME = "test_db"
+# Under pytest-xdist each worker (gw0, gw1, ...) gets its own databases
+XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER")
+TEST_DB_NAME = f"test_db_{XDIST_WORKER}" if XDIST_WORKER else "test_db"
+TEST_MONGO_DB_NAME = f"test_audit_logs_{XDIST_WORKER}" if XDIST_WORKER else "test_audit_logs"
 
 # URL for connecting to the default 'postgres' database to create/drop the test db
 DEFAULT_DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{DB_HOST}:5432/postgres"
 # URL for the test database
 TEST_DATABASE_URL = f"postgresql+asyncpg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@{DB_HOST}:5432/{TEST_DB_NAME}"
 
-# Create test engine with NullPool to avoid connection reuse issues
-test_engine = create_async_engine(
-    TEST_DATABASE_URL, 
-    echo=False, 
-    future=True,
-    poolclass=NullPool  # Disable connection pooling to avoid conflicts
-)
+# Tests share one long-lived connection (see `db_connection`), so there is
+# nothing for a pool to do
+test_engine = create_async_engine(TEST_DATABASE_URL, poolclass=NullPool)
 TestSessionLocal = sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
 
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the suite on uvloop when it is installed, as uvicorn does in production."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.DefaultEventLoopPolicy()
+    return uvloop.EventLoopPolicy()
+
+
 @pytest.fixture(scope="session", autouse=True)
 async def setup_test_db():
-    """Create test database before tests and drop it after."""
-    default_engine = create_async_engine(DEFAULT_DATABASE_URL, isolation_level="AUTOCOMMIT")
+    """
+    Create the test database if it does not exist yet.
+    
+    The database is kept between runs: tests never leave data behind (see
+    `session`), and init_db rebuilds the schema at the start of each run.
+    """
+    default_engine = create_async_engine(
+        DEFAULT_DATABASE_URL, isolation_level="AUTOCOMMIT", poolclass=NullPool
+    )
     
     try:
         async with default_engine.connect() as conn:
-            result = await conn.execute(text(f"SELECT 1 FROM pg_database WHERE datname = '{TEST_DB_NAME}'"))
-            if not result.scalar():
-                await conn.execute(text(f"CREATE DATABASE {TEST_DB_NAME}"))
-    except Exception:
-        raise
-    
-    await default_engine.dispose()
+            exists = await conn.scalar(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": TEST_DB_NAME}
+            )
+            if not exists:
+                # CREATE DATABASE takes no bind parameters (nor runs in a DO block)
+                db_ident = conn.dialect.identifier_preparer.quote(TEST_DB_NAME)
+                await conn.execute(text(f"CREATE DATABASE {db_ident}"))
+    finally:
+        await default_engine.dispose()
     
     yield
-    
-    # Drop test database after tests
-    default_engine = create_async_engine(DEFAULT_DATABASE_URL, isolation_level="AUTOCOMMIT")
-    async with default_engine.connect() as conn:
-        await conn.execute(text(f"""
-            SELECT pg_terminate_backend(pg_stat_activity.pid)
-            FROM pg_stat_activity
-            WHERE pg_stat_activity.datname = '{TEST_DB_NAME}'
-            AND pid <> pg_backend_pid()
-        """))
-        await conn.execute(text(f"DROP DATABASE IF EXISTS {TEST_DB_NAME}"))
-    
-    await default_engine.dispose()
 
 
 
 @pytest.fixture(scope="session", autouse=True)
 async def init_db(setup_test_db):
+    """Build the schema once per run (drop first so model changes apply)."""
     async with test_engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.drop_all)
         await conn.run_sync(SQLModel.metadata.create_all)
     yield
-    async with test_engine.begin() as conn:
-        await conn.run_sync(SQLModel.metadata.drop_all)
+
+@pytest.fixture(scope="session")
+async def db_connection(init_db):
+    """One connection for the whole run; every test's session binds to it."""
+    async with test_engine.connect() as conn:
+        yield conn
+
+@pytest.fixture(scope="class")
+async def class_session(db_connection) -> AsyncSession:
+    """
+    Session for data shared by every test in a class.
+    
+    Its transaction stays open until the class finishes and is then
+    rolled back; each test's `session` runs in a SAVEPOINT inside it.
+    """
+    outer = await db_connection.begin()
+    async with TestSessionLocal(
+        bind=db_connection, join_transaction_mode="create_savepoint"
+    ) as session:
+        yield session
+    await outer.rollback()
 
 @pytest.fixture
-async def session() -> AsyncSession:
-    """Provide a database session for direct test use."""
-    async with TestSessionLocal() as session:
+async def session(db_connection) -> AsyncSession:
+    """
+    Provide a database session for direct test use.
+    
+    The session joins an outer transaction that is rolled back after the
+    test; commit() (from the test or from app code) only releases a
+    SAVEPOINT. Nothing a test writes is visible to any other test.
+    """
+    if db_connection.in_transaction():
+        # Inside a class_session: keep its data, roll back only this test's
+        outer = await db_connection.begin_nested()
+    else:
+        outer = await db_connection.begin()
+    async with TestSessionLocal(
+        bind=db_connection, join_transaction_mode="create_savepoint"
+    ) as session:
         yield session
-        # Rollback any uncommitted changes
-        await session.rollback()
+    await outer.rollback()
 
 @pytest.fixture
-async def client(session: AsyncSession) -> AsyncClient:
+def seed(session: AsyncSession):
     """
-    Create test client that shares the test session.
+    Insert rows for a test: `await seed(obj, ...)`.
+    
+    Flushes instead of committing; the rows are visible to everything
+    using `session` and disappear with the test's rollback.
+    """
+    async def _seed(*objs):
+        session.add_all(objs)
+        await session.flush()
+        return objs
+    
+    return _seed
+
+@pytest.fixture(scope="session")
+async def http_client() -> AsyncClient:
+    """
+    One ASGI transport and AsyncClient shared by the whole test run.
+    All tests run on the session event loop (see pyproject.toml), so the
+    client can outlive a single test.
+    """
+    transport = ASGITransport(app=main_app)
+    async with AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+@pytest.fixture
+async def client(http_client: AsyncClient, session: AsyncSession) -> AsyncClient:
+    """
+    Test client that shares the test session.
     This ensures data seeded in tests is visible to API endpoints.
     """
     
@@ -96,13 +163,30 @@ async def client(session: AsyncSession) -> AsyncClient:
         """Override dependency to use the test session."""
         yield session
     
+    # Re-installed per test: tests clear overrides on teardown
     main_app.dependency_overrides[get_db] = override_get_db
-    transport = ASGITransport(app=main_app)
-    async with AsyncClient(transport=transport, base_url="http://test") as c:
-        yield c
+    http_client.cookies.clear()
+    yield http_client
     main_app.dependency_overrides.clear()
 
 
+@pytest.fixture(scope="module")
+def shared_mock_session() -> MagicMock:
+    """
+    A mock database session built once per test module.
+    
+    Only handed to constructors and compared by identity, so a plain
+    MagicMock does; tests that await the session should use a real one.
+    """
+    return MagicMock()
+
+@pytest.fixture
+def mock_session(shared_mock_session: MagicMock) -> MagicMock:
+    """Mock database session for repository unit tests, reset per test."""
+    shared_mock_session.reset_mock(return_value=True, side_effect=True)
+    return shared_mock_session
+
+
 @pytest.fixture(autouse=True)
 def reset_redis():
     """Reset Redis client before each test to avoid event loop conflicts."""
@@ -117,7 +201,7 @@ def setup_mongo_test_db():
     
     # Store original and set test database name
     original_db_name = mongodb.db_name
-    mongodb.db_name = "test_audit_logs"
+    mongodb.db_name = TEST_MONGO_DB_NAME
     
     # Force fresh connection
     mongodb.close()
@@ -143,7 +227,7 @@ async def clean_mongo(setup_mongo_test_db):
     db = mongodb.get_db()
     
     # Safe cleanup that ignores connection errors
-    if db is not None and db.name == "test_audit_logs":
+    if db is not None and db.name == TEST_MONGO_DB_NAME:
         try:
             await db["audit_logs"].delete_many({})
         except Exception:
@@ -155,7 +239,7 @@ async def clean_mongo(setup_mongo_test_db):
     try:
         if mongodb.client is not None:
             db = mongodb.get_db()
-            if db is not None and db.name == "test_audit_logs":
+            if db is not None and db.name == TEST_MONGO_DB_NAME:
                 await db["audit_logs"].delete_many({})
     except Exception:
         pass
@@ -3,8 +3,14 @@
 Management CLI for FastAPI project.
 Commands run locally by default. Use --docker to run in Docker container.
 """
+import hashlib
+import json
 import os
-import subprocess
+import re
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional
+
 import typer
 from rich.console import Console
 
@@ -12,6 +18,22 @@ app = typer.Typer(help="Management script for the FastAPI project.")
 console = Console()
 
 
+def exec_command(cmd: List[str], env: Optional[Dict[str, str]] = None) -> None:
+    """
+    Replace the CLI process with `cmd`.
+    
+    The command inherits our PID, so signals (Ctrl+C, docker stop) and the
+    exit code go straight to it and no idle Python process is left behind.
+    """
+    # exec discards Python's buffers; make sure the banner is written first
+    sys.stdout.flush()
+    sys.stderr.flush()
+    if env is None:
+        os.execvp(cmd[0], cmd)
+    else:
+        os.execvpe(cmd[0], cmd, env)
+
+
 @app.command()
 def run(
     env: str = typer.Option("dev", help="Environment to run in (dev/prod)"),
@@ -25,7 +47,7 @@ def run(
         cmd.append("--reload")
     
     console.print(f"[green]Starting server in {env} mode...[/green]")
-    subprocess.run(cmd)
+    exec_command(cmd)
 
 
 @app.command(context_settings={"allow_extra_args": True, "ignore_unknown_options": True})
@@ -46,6 +68,7 @@ def test(
             "web", "pytest"
         ]
         cmd.extend(ctx.args)
+        exec_command(cmd)
     else:
         console.print("[green]Running tests locally...[/green]")
         cmd = ["pytest"]
@@ -57,7 +80,7 @@ def test(
         # Set PYTHONPATH to current directory to resolve 'app' module
         env = os.environ.copy()
         env["PYTHONPATH"] = "."
-        subprocess.run(cmd, env=env)
+        exec_command(cmd, env=env)
 
 
 @app.command()
@@ -79,7 +102,7 @@ def migrate(
     if message:
         cmd.extend(["-m", message])
         
-    subprocess.run(cmd)
+    exec_command(cmd)
 
 
 @app.command()
@@ -95,7 +118,7 @@ def upgrade(
         console.print(f"[green]Upgrading database to {revision} locally...[/green]")
         cmd = ["alembic", "upgrade", revision]
         
-    subprocess.run(cmd)
+    exec_command(cmd)
 
 
 @app.command()
@@ -111,7 +134,7 @@ def downgrade(
         console.print(f"[green]Downgrading database to {revision} locally...[/green]")
         cmd = ["alembic", "downgrade", revision]
         
-    subprocess.run(cmd)
+    exec_command(cmd)
 
 
 @app.command("docker")
@@ -130,7 +153,7 @@ def docker_cmd(
             cmd.append("-d")
             
     console.print(f"[green]Running docker-compose {action} for {env}...[/green]")
-    subprocess.run(cmd)
+    exec_command(cmd)
 
 
 
@@ -505,23 +528,9 @@ async def test_list_{module_name}s_filtering(client: AsyncClient):
 
 # ==================== SEEDER COMMANDS ====================
 
-@app.command("make:seeder")
-def make_seeder(
-    name: str = typer.Argument(..., help="Name of the seeder (e.g., 'users' creates UsersSeeder)"),
-):
-    """Create a new seeder file from template."""
-    # Convert name to class name (e.g., "users" -> "UsersSeeder", "oauth_providers" -> "OAuthProvidersSeeder")
-    class_name = "".join(word.capitalize() for word in name.split("_")) + "Seeder"
-    file_name = f"{name.lower()}_seeder.py"
-    file_path = os.path.join("seeders", file_name)
-    
-    if os.path.exists(file_path):
-        console.print(f"[red]Seeder already exists: {file_path}[/red]")
-        raise typer.Exit(1)
-    
-    # Generate seeder content
-    display_name = name.replace("_", " ").title()
-    content = f'''"""
+SEEDER_NAME_PATTERN = re.compile(r"[a-z][a-z0-9_]*")
+
+SEEDER_TEMPLATE = '''"""
 {display_name} Seeder
 """
 from sqlmodel import select
@@ -529,7 +538,7 @@ from seeders.base import BaseSeeder
 
 
 class {class_name}(BaseSeeder):
-    """Seed {display_name.lower()} data."""
+    """Seed {display_name_lower} data."""
     
     order = 100  # Adjust order as needed (lower runs first)
     
@@ -545,13 +554,37 @@ class {class_name}(BaseSeeder):
         # Example:
         # item = MyModel(name="test")
         # self.session.add(item)
-        # await self.session.commit()
+        # await self.session.flush()  # the runner commits once at the end
         pass
 '''
+
+
+@app.command("make:seeder")
+def make_seeder(
+    name: str = typer.Argument(..., help="Name of the seeder (e.g., 'users' creates UsersSeeder)"),
+):
+    """Create a new seeder file from template."""
+    name = name.lower()
+    # Also keeps the name from escaping the seeders/ directory (e.g. "../x")
+    if not SEEDER_NAME_PATTERN.fullmatch(name):
+        console.print("[red]Seeder name must be snake_case: a letter followed by letters, digits or '_'[/red]")
+        raise typer.Exit(1)
     
-    # Write seeder file
-    with open(file_path, "w") as f:
-        f.write(content)
+    # Convert name to class name (e.g., "users" -> "UsersSeeder", "oauth_providers" -> "OauthProvidersSeeder")
+    class_name = "".join(word.capitalize() for word in name.split("_")) + "Seeder"
+    file_path = Path("seeders") / f"{name}_seeder.py"
+    
+    if file_path.exists():
+        console.print(f"[red]Seeder already exists: {file_path}[/red]")
+        raise typer.Exit(1)
+    
+    # Generate and write seeder file
+    display_name = name.replace("_", " ").title()
+    file_path.write_text(SEEDER_TEMPLATE.format_map({
+        "class_name": class_name,
+        "display_name": display_name,
+        "display_name_lower": display_name.lower(),
+    }))
     
     console.print(f"[green]Created seeder: {file_path}[/green]")
     console.print(f"[dim]Class: {class_name}[/dim]")
@@ -568,31 +601,11 @@ def db_seed(
         console.print("[green]Running seeders in Docker...[/green]")
         
         # Build the Python command to run
-        if seeder:
-            python_cmd = f"""
-import asyncio
-from app.core.database import engine
-from sqlmodel.ext.asyncio.session import AsyncSession
-from seeders.runner import run_seeder
-
-async def main():
-    async with AsyncSession(engine) as session:
-        await run_seeder(session, '{seeder}', force={force})
-
-asyncio.run(main())
-"""
-        else:
-            python_cmd = f"""
-import asyncio
-from app.core.database import engine
-from sqlmodel.ext.asyncio.session import AsyncSession
-from seeders.runner import run_all_seeders
-
-async def main():
-    async with AsyncSession(engine) as session:
-        await run_all_seeders(session, force={force})
+        seeder_arg = repr(seeder) if seeder else "None"
+        python_cmd = f"""
+from seeders.runner import run_seed
 
-asyncio.run(main())
+run_seed({seeder_arg}, force={force})
 """
         
         cmd = [
@@ -600,22 +613,12 @@ asyncio.run(main())
             "run", "--rm", "web",
             "python", "-c", python_cmd
         ]
-        subprocess.run(cmd)
+        exec_command(cmd)
     else:
         console.print("[green]Running seeders locally...[/green]")
-        import asyncio
-        from app.core.database import engine
-        from sqlmodel.ext.asyncio.session import AsyncSession
-        from seeders.runner import run_all_seeders, run_seeder as run_seeder_func
+        from seeders.runner import run_seed
         
-        async def run():
-            async with AsyncSession(engine) as session:
-                if seeder:
-                    await run_seeder_func(session, seeder, force=force)
-                else:
-                    await run_all_seeders(session, force=force)
-        
-        asyncio.run(run())
+        run_seed(seeder, force=force)
 
 
 @app.command("db:seed:list")
@@ -635,5 +638,66 @@ def db_seed_list():
     console.print()
 
 
+# ==================== OPENAPI COMMANDS ====================
+
+OPENAPI_CACHE_DIR = Path.home() / ".cache" / "fastapi-openapi"
+
+
+def _openapi_cache_key() -> str:
+    """
+    Hash of everything that can change the schema: source and .env files
+    (path, mtime, size), Settings values taken from the process environment,
+    and the installed FastAPI/Pydantic versions.
+    """
+    import fastapi
+    import pydantic
+    from app.core.config import Settings
+    
+    files = sorted(Path("app").rglob("*.py"))
+    if Path(".env").exists():
+        files.append(Path(".env"))
+    fingerprint = [(str(f.resolve()), f.stat().st_mtime_ns, f.stat().st_size) for f in files]
+    fingerprint.append(sorted(
+        (name, os.environ[name]) for name in Settings.model_fields if name in os.environ
+    ))
+    fingerprint.append((fastapi.__version__, pydantic.VERSION))
+    return hashlib.sha1(repr(fingerprint).encode()).hexdigest()
+
+
+@app.command("openapi")
+def openapi_export(
+    output: Path = typer.Option(None, "--output", "-o", help="Write the schema to this file instead of stdout"),
+    no_cache: bool = typer.Option(False, "--no-cache", help="Regenerate even if a cached schema exists"),
+):
+    """Export the OpenAPI schema (cached until files under app/ change)."""
+    # One cache entry per project, overwritten whenever the key changes
+    project_id = hashlib.sha1(str(Path.cwd().resolve()).encode()).hexdigest()
+    cache_file = OPENAPI_CACHE_DIR / f"{project_id}.json"
+    key = _openapi_cache_key()
+    
+    cached = None
+    if cache_file.exists() and not no_cache:
+        try:
+            cached = json.loads(cache_file.read_text())
+        except ValueError:
+            cached = None
+    
+    if cached and cached.get("key") == key:
+        schema_json = cached["schema"]
+    else:
+        # Importing the app and walking every route is the slow part
+        from app.main import app as fastapi_app
+        
+        schema_json = json.dumps(fastapi_app.openapi(), indent=2)
+        OPENAPI_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"key": key, "schema": schema_json}))
+    
+    if output:
+        output.write_text(schema_json + "\n")
+        console.print(f"[green]OpenAPI schema written to {output}[/green]")
+    else:
+        sys.stdout.write(schema_json + "\n")
+
+
 if __name__ == "__main__":
     app()
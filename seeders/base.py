@@ -2,6 +2,8 @@
 Base seeder class that all seeders should inherit from.
 """
 from abc import ABC, abstractmethod
+from typing import Iterable, Sequence
+
 from sqlmodel.ext.asyncio.session import AsyncSession
 
 
@@ -24,6 +26,25 @@ class BaseSeeder(ABC):
         """Check if this seeder should run (e.g., data doesn't already exist)."""
         pass
     
+    async def copy_records(
+        self,
+        table: str,
+        columns: Sequence[str],
+        records: Iterable[tuple]
+    ) -> None:
+        """
+        Bulk-load rows with COPY FROM STDIN on the session's own connection,
+        so they are part of the seeding transaction.
+        
+        COPY has no ON CONFLICT handling: only use it for rows known to be new.
+        Values must be native Python types (e.g. uuid.UUID, not str).
+        """
+        connection = await self.session.connection()
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            table, records=list(records), columns=list(columns)
+        )
+    
     @property
     def name(self) -> str:
         """Return the seeder name."""
@@ -1,12 +1,23 @@
 """
 Permissions Seeder - Seeds all system permissions from PermissionEnum.
 """
+from datetime import datetime
+from uuid import uuid4
+
 from sqlmodel import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from seeders.base import BaseSeeder
-from app.models.role import Permission
+from app.modules.roles.models import Permission
 from app.constants import PermissionEnum
 
 
+# (code, description) pairs, built once at import time
+PERMISSIONS_DATA: tuple[tuple[str, str], ...] = tuple(
+    (perm.value, perm.value.replace(":", " ").replace("_", " ").title())
+    for perm in PermissionEnum
+)
+
+
 class PermissionsSeeder(BaseSeeder):
     """Seed all system permissions from PermissionEnum."""
     
@@ -14,25 +25,35 @@ class PermissionsSeeder(BaseSeeder):
     
     async def should_run(self) -> bool:
         """Check if permissions need to be seeded."""
-        result = await self.session.execute(select(Permission).limit(1))
-        return result.first() is None
+        existing = await self.session.scalar(select(Permission.id).limit(1))
+        return existing is None
     
     async def run(self) -> None:
         """Create all permissions from PermissionEnum."""
-        for perm in PermissionEnum:
-            # Check if permission already exists
+        # Only fetch the codes that already exist (index lookup on code)
+        codes = [code for code, _ in PERMISSIONS_DATA]
+        existing = set(
+            (await self.session.scalars(
+                select(Permission.code).where(Permission.code.in_(codes))
+            )).all()
+        )
+        
+        now = datetime.utcnow()
+        rows = [
+            {"id": uuid4(), "code": code, "description": description, "created_at": now}
+            for code, description in PERMISSIONS_DATA
+            if code not in existing
+        ]
+        
+        inserted = 0
+        if rows:
+            # Single multi-row INSERT; ON CONFLICT covers a concurrent seeder
             result = await self.session.execute(
-                select(Permission).where(Permission.code == perm.value)
-            )
-            if result.first():
-                continue
-            
-            # Create permission
-            permission = Permission(
-                code=perm.value,
-                description=perm.value.replace(":", " ").replace("_", " ").title()
+                pg_insert(Permission)
+                .values(rows)
+                .on_conflict_do_nothing(index_elements=["code"])
+                .returning(Permission.id)
             )
-            self.session.add(permission)
+            inserted = len(result.all())
         
-        await self.session.commit()
-        print(f"  ✅ Seeded {len(PermissionEnum)} permissions")
+        print(f"  ✅ Seeded {inserted} permissions ({len(PERMISSIONS_DATA) - inserted} already present)")
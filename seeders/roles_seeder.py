@@ -3,7 +3,7 @@ Roles Seeder - Seeds default system roles.
 """
 from sqlmodel import select
 from seeders.base import BaseSeeder
-from app.models.role import Role, Permission
+from app.modules.roles.models import Role, Permission, RolePermission
 
 
 class RolesSeeder(BaseSeeder):
@@ -51,36 +51,50 @@ class RolesSeeder(BaseSeeder):
     async def run(self) -> None:
         """Create default roles with permissions."""
         # Get all permissions
-        result = await self.session.execute(select(Permission))
-        all_permissions = {p.code: p for p in result.scalars().all()}
+        result = await self.session.execute(select(Permission.code, Permission.id))
+        all_permissions = dict(result.all())
         
+        # Find which default roles already exist (one query for all of them)
+        names = [role_data["name"] for role_data in self.DEFAULT_ROLES]
+        result = await self.session.execute(select(Role.name).where(Role.name.in_(names)))
+        existing = set(result.scalars().all())
+        
+        new_roles = []
         for role_data in self.DEFAULT_ROLES:
-            # Check if role exists
-            result = await self.session.execute(
-                select(Role).where(Role.name == role_data["name"])
-            )
-            if result.first():
+            if role_data["name"] in existing:
                 continue
             
-            # Create role
             role = Role(
                 name=role_data["name"],
                 description=role_data["description"],
                 is_system=role_data["is_system"]
             )
-            
-            # Assign permissions
-            perm_codes = role_data["permissions"]
+            new_roles.append((role, role_data["permissions"]))
+        
+        if not new_roles:
+            print("  ✅ Seeded 0 roles")
+            return
+        
+        self.session.add_all([role for role, _ in new_roles])
+        await self.session.flush()  # Get role IDs
+        
+        # Link rows reference roles created above, so they cannot conflict:
+        # bulk-load them with COPY
+        links = []
+        for role, perm_codes in new_roles:
             if "*" in perm_codes:
                 # All permissions
-                role.permissions = list(all_permissions.values())
+                perm_ids = all_permissions.values()
             else:
-                role.permissions = [
-                    all_permissions[code] for code in perm_codes 
+                perm_ids = [
+                    all_permissions[code] for code in perm_codes
                     if code in all_permissions
                 ]
-            
-            self.session.add(role)
+            links.extend((role.id, perm_id) for perm_id in perm_ids)
+        
+        if links:
+            await self.copy_records(
+                RolePermission.__tablename__, ("role_id", "permission_id"), links
+            )
         
-        await self.session.commit()
-        print(f"  ✅ Seeded {len(self.DEFAULT_ROLES)} roles")
+        print(f"  ✅ Seeded {len(new_roles)} roles")
@@ -1,15 +1,34 @@
 """
 Seeder runner - discovers and runs all seeders.
 """
+import asyncio
 import importlib
 import pkgutil
 from pathlib import Path
-from typing import List, Type
+from typing import List, Optional, Type
 
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlmodel.ext.asyncio.session import AsyncSession
 from seeders.base import BaseSeeder
 
 
+def create_seeder_engine() -> AsyncEngine:
+    """
+    Create a dedicated engine for seeding.
+    
+    Seeding is a one-shot run on a single session, i.e. a single fresh
+    connection: NullPool skips pool bookkeeping and pre-ping round-trips.
+    """
+    from app.core.config import settings
+    
+    return create_async_engine(
+        settings.SQLALCHEMY_DATABASE_URI,
+        poolclass=NullPool,
+        pool_pre_ping=False,
+    )
+
+
 def discover_seeders() -> List[Type[BaseSeeder]]:
     """Discover all seeder classes in the seeders directory."""
     seeders = []
@@ -36,7 +55,11 @@ def discover_seeders() -> List[Type[BaseSeeder]]:
 
 
 async def run_all_seeders(session: AsyncSession, force: bool = False) -> None:
-    """Run all discovered seeders."""
+    """
+    Run all discovered seeders in a single transaction.
+    
+    Seeders only flush; the session is committed once after the last one.
+    """
     seeders = discover_seeders()
     
     if not seeders:
@@ -53,6 +76,8 @@ async def run_all_seeders(session: AsyncSession, force: bool = False) -> None:
             await seeder.run()
         else:
             print(f"Skipping {seeder.name} (already seeded)")
+    
+    await session.commit()
 
 
 async def run_seeder(session: AsyncSession, seeder_name: str, force: bool = False) -> None:
@@ -67,6 +92,7 @@ async def run_seeder(session: AsyncSession, seeder_name: str, force: bool = Fals
             if force or await seeder.should_run():
                 print(f"Running {seeder.name}...")
                 await seeder.run()
+                await session.commit()
             else:
                 print(f"Skipping {seeder.name} (already seeded)")
             return
@@ -75,3 +101,33 @@ async def run_seeder(session: AsyncSession, seeder_name: str, force: bool = Fals
     print("Available seeders:")
     for s in seeders:
         print(f"  - {s.__name__}")
+
+
+async def seed(seeder_name: Optional[str] = None, force: bool = False) -> None:
+    """Run one seeder (or all of them) with a shared engine and session."""
+    engine = create_seeder_engine()
+    try:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            if seeder_name:
+                await run_seeder(session, seeder_name, force=force)
+            else:
+                await run_all_seeders(session, force=force)
+    finally:
+        await engine.dispose()
+
+
+def run_seed(seeder_name: Optional[str] = None, force: bool = False) -> None:
+    """
+    Blocking entry point for seed().
+    
+    Uses uvloop when it is installed (it ships with uvicorn[standard] on
+    Linux/macOS) and falls back to the default asyncio loop otherwise.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        loop_factory = None
+    else:
+        loop_factory = uvloop.new_event_loop
+    
+    asyncio.run(seed(seeder_name, force=force), loop_factory=loop_factory)
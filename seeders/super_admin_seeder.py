@@ -1,10 +1,13 @@
 """
 Super Admin Seeder - Creates the default super admin user.
 """
+import asyncio
+
 from sqlmodel import select
+from sqlalchemy import exists
 from seeders.base import BaseSeeder
-from app.models.user import User, Admin
-from app.models.role import Role
+from app.modules.users.models import User, Admin
+from app.modules.roles.models import Role
 from app.constants.enums import UserType
 from app.core.security import get_password_hash
 from app.core.config import settings
@@ -24,31 +27,49 @@ class SuperAdminSeeder(BaseSeeder):
     
     async def run(self) -> None:
         """Create the super admin user."""
-        # Get SUPER_ADMIN role
-        result = await self.session.execute(
-            select(Role).where(Role.name == "SUPER_ADMIN")
-        )
-        role = result.scalar_one_or_none()
-        
-        if not role:
-            print("  ❌ SUPER_ADMIN role not found. Run RolesSeeder first.")
-            return
-        
-        # Check if user with this email exists
         email = getattr(settings, 'SUPER_ADMIN_EMAIL', 'admin@example.com')
         password = getattr(settings, 'SUPER_ADMIN_PASSWORD', 'Admin@123')
+        username = "superadmin"
         
-        result = await self.session.execute(
-            select(User).where(User.email == email)
-        )
-        if result.first():
-            print(f"  ⚠️  User with email {email} already exists")
-            return
+        # bcrypt is pure CPU and releases the GIL: hash in a worker thread
+        # while the lookup below is in flight
+        hash_task = asyncio.create_task(asyncio.to_thread(get_password_hash, password))
+        
+        try:
+            # Role id and both uniqueness checks in a single round-trip
+            result = await self.session.execute(
+                select(
+                    select(Role.id).where(Role.name == "SUPER_ADMIN").scalar_subquery(),
+                    exists().where(User.email == email),
+                    exists().where(Admin.username == username),
+                )
+            )
+            role_id, email_taken, username_taken = result.one()
+            
+            if not role_id:
+                print("  ❌ SUPER_ADMIN role not found. Run RolesSeeder first.")
+                return
+            
+            if email_taken:
+                print(f"  ⚠️  User with email {email} already exists")
+                return
+            
+            if username_taken:
+                print(f"  ⚠️  Admin with username {username} already exists")
+                return
+            
+            hashed_password = await hash_task
+        finally:
+            # Early returns and lookup errors never consume the hash: cancel
+            # it and collect the outcome so no task is left pending
+            if not hash_task.done():
+                hash_task.cancel()
+            await asyncio.gather(hash_task, return_exceptions=True)
         
         # Create user
         user = User(
             email=email,
-            hashed_password=get_password_hash(password),
+            hashed_password=hashed_password,
             user_type=UserType.ADMIN,
             is_active=True,
             is_verified=True
@@ -59,11 +80,11 @@ class SuperAdminSeeder(BaseSeeder):
         # Create admin profile
         admin = Admin(
             user_id=user.id,
-            username="superadmin",
-            role_id=role.id,
+            username=username,
+            role_id=role_id,
             is_super_admin=True
         )
         self.session.add(admin)
-        await self.session.commit()
+        await self.session.flush()
         
         print(f"  ✅ Created super admin: {email}")
@@ -1,6 +1,8 @@
 """
 Constants and Enums tests.
 """
+import pytest
+
 from app.constants.enums import UserType, OTPType
 from app.constants.error_codes import ErrorCode
 
@@ -21,24 +23,22 @@ class TestEnums:
 class TestErrorCodes:
     """Test error code constants."""
     
-    def test_auth_error_codes(self):
-        """Test authentication error codes exist."""
-        assert ErrorCode.INVALID_CREDENTIALS == "AUTH_001"
-        assert ErrorCode.EMAIL_NOT_VERIFIED == "AUTH_002"
-        assert ErrorCode.INVALID_TOKEN == "AUTH_004"
-    
-    def test_oauth_error_codes(self):
-        """Test OAuth error codes exist."""
-        assert ErrorCode.OAUTH_ERROR == "OAUTH_001"
-        assert ErrorCode.OAUTH_PROVIDER_NOT_FOUND == "OAUTH_003"
-    
-    def test_otp_error_codes(self):
-        """Test OTP error codes exist."""
-        assert ErrorCode.OTP_INVALID == "OTP_001"
-        assert ErrorCode.OTP_EXPIRED == "OTP_002"
-        assert ErrorCode.OTP_COOLDOWN == "OTP_004"
-    
-    def test_permission_error_codes(self):
-        """Test permission error codes exist."""
-        assert ErrorCode.PERMISSION_DENIED == "PERM_001"
-        assert ErrorCode.ROLE_NOT_FOUND == "PERM_002"
+    @pytest.mark.parametrize("attr,expected", [
+        # Authentication
+        ("INVALID_CREDENTIALS", "AUTH_001"),
+        ("EMAIL_NOT_VERIFIED", "AUTH_002"),
+        ("INVALID_TOKEN", "AUTH_004"),
+        # OAuth
+        ("OAUTH_ERROR", "OAUTH_001"),
+        ("OAUTH_PROVIDER_NOT_FOUND", "OAUTH_003"),
+        # OTP
+        ("OTP_INVALID", "OTP_001"),
+        ("OTP_EXPIRED", "OTP_002"),
+        ("OTP_COOLDOWN", "OTP_004"),
+        # Permissions
+        ("PERMISSION_DENIED", "PERM_001"),
+        ("ROLE_NOT_FOUND", "PERM_002"),
+    ])
+    def test_error_code(self, attr, expected):
+        """Test error codes keep their wire values."""
+        assert getattr(ErrorCode, attr) == expected
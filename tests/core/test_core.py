@@ -5,6 +5,28 @@ Run with: pytest tests/test_core.py -v
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
+from jinja2 import TemplateNotFound
+from app.core.security import (
+    generate_otp,
+    hash_otp,
+    verify_otp,
+    get_password_hash,
+    verify_password,
+    create_access_token,
+    decode_token
+)
+from app.core.exceptions import (
+    AuthenticationError,
+    PermissionDeniedError,
+    NotFoundError,
+    ConflictError,
+    ValidationError,
+    RateLimitError
+)
+from app.constants.error_codes import ErrorCode
+from app.core.config import settings
+from app.core.docs import doc_responses
+from app.core.email import EmailService
 
 
 class TestSecurityFunctions:
@@ -12,8 +34,6 @@ class TestSecurityFunctions:
     
     def test_generate_otp(self):
         """Test OTP generation."""
-        from app.core.security import generate_otp
-        
         otp = generate_otp()
         assert len(otp) == 6
         assert otp.isdigit()
@@ -24,8 +44,6 @@ class TestSecurityFunctions:
     
     def test_hash_otp(self):
         """Test OTP hashing."""
-        from app.core.security import hash_otp
-        
         otp = "123456"
         hashed = hash_otp(otp)
         
@@ -35,8 +53,6 @@ class TestSecurityFunctions:
     
     def test_verify_otp_correct(self):
         """Test OTP verification with correct code."""
-        from app.core.security import hash_otp, verify_otp
-        
         otp = "654321"
         hashed = hash_otp(otp)
         
@@ -44,8 +60,6 @@ class TestSecurityFunctions:
     
     def test_verify_otp_incorrect(self):
         """Test OTP verification with incorrect code."""
-        from app.core.security import hash_otp, verify_otp
-        
         otp = "654321"
         hashed = hash_otp(otp)
         
@@ -53,8 +67,6 @@ class TestSecurityFunctions:
     
     def test_password_hash_and_verify(self):
         """Test password hashing and verification."""
-        from app.core.security import get_password_hash, verify_password
-        
         password = "SecurePassword123!"
         hashed = get_password_hash(password)
         
@@ -67,8 +79,6 @@ class TestJWTFunctions:
     
     def test_create_access_token(self):
         """Test access token creation."""
-        from app.core.security import create_access_token
-        
         # Token takes a dict with "sub" key
         token = create_access_token(data={"sub": "user-123", "role": "CUSTOMER"})
         
@@ -78,8 +88,6 @@ class TestJWTFunctions:
     
     def test_decode_access_token(self):
         """Test access token decoding."""
-        from app.core.security import create_access_token, decode_token
-        
         token = create_access_token(data={"sub": "user-123", "role": "ADMIN"})
         
         # Decode using the app's decode function
@@ -90,8 +98,6 @@ class TestJWTFunctions:
     
     def test_decode_invalid_token(self):
         """Test decoding invalid token returns None."""
-        from app.core.security import decode_token
-        
         result = decode_token("invalid.token.here")
         assert result is None
 
@@ -101,9 +107,6 @@ class TestExceptions:
     
     def test_authentication_error(self):
         """Test AuthenticationError exception."""
-        from app.core.exceptions import AuthenticationError
-        from app.constants.error_codes import ErrorCode
-        
         error = AuthenticationError(
             error_code=ErrorCode.INVALID_CREDENTIALS,
             message="Wrong password"
@@ -113,9 +116,6 @@ class TestExceptions:
     
     def test_permission_denied_error(self):
         """Test PermissionDeniedError exception (not AuthorizationError)."""
-        from app.core.exceptions import PermissionDeniedError
-        from app.constants.error_codes import ErrorCode
-        
         error = PermissionDeniedError(
             error_code=ErrorCode.PERMISSION_DENIED,
             message="Access denied"
@@ -125,9 +125,6 @@ class TestExceptions:
     
     def test_not_found_error(self):
         """Test NotFoundError exception."""
-        from app.core.exceptions import NotFoundError
-        from app.constants.error_codes import ErrorCode
-        
         error = NotFoundError(
             error_code=ErrorCode.USER_NOT_FOUND,
             message="User not found"
@@ -137,9 +134,6 @@ class TestExceptions:
     
     def test_conflict_error(self):
         """Test ConflictError exception."""
-        from app.core.exceptions import ConflictError
-        from app.constants.error_codes import ErrorCode
-        
         error = ConflictError(
             error_code=ErrorCode.USER_ALREADY_EXISTS,
             message="User exists"
@@ -149,9 +143,6 @@ class TestExceptions:
     
     def test_validation_error(self):
         """Test ValidationError exception."""
-        from app.core.exceptions import ValidationError
-        from app.constants.error_codes import ErrorCode
-        
         error = ValidationError(
             error_code=ErrorCode.FIELD_INVALID,
             message="Invalid field",
@@ -163,9 +154,6 @@ class TestExceptions:
     
     def test_rate_limit_error(self):
         """Test RateLimitError exception."""
-        from app.core.exceptions import RateLimitError
-        from app.constants.error_codes import ErrorCode
-        
         error = RateLimitError(
             error_code=ErrorCode.OTP_COOLDOWN,
             message="Too many requests",
@@ -182,8 +170,6 @@ class TestConfig:
     
     def test_settings_instance(self):
         """Test settings can be instantiated."""
-        from app.core.config import settings
-        
         assert settings is not None
         assert hasattr(settings, 'SECRET_KEY')
         assert hasattr(settings, 'ALGORITHM')
@@ -191,8 +177,6 @@ class TestConfig:
     
     def test_settings_required_values(self):
         """Test that required settings have values."""
-        from app.core.config import settings
-        
         assert settings.SECRET_KEY is not None
         assert len(settings.SECRET_KEY) > 0
         
@@ -206,8 +190,6 @@ class TestDocs:
     
     def test_doc_responses(self):
         """Test doc_responses helper."""
-        from app.core.docs import doc_responses
-        
         responses = doc_responses(
             success_example={"id": "123"},
             success_message="Success",
@@ -219,3 +201,22 @@ class TestDocs:
         assert 403 in responses
         assert 404 in responses
 
+
+
+class TestEmailTemplates:
+    """Test email template rendering."""
+    
+    def test_render_template(self):
+        """Test a bundled template renders its context."""
+        html = EmailService.render_template('otp.html', {
+            'otp': '482913',
+            'purpose': 'email verification',
+            'app_name': 'Test App'
+        })
+        
+        assert '482913' in html
+    
+    def test_render_missing_template(self):
+        """Test rendering an unknown template raises TemplateNotFound."""
+        with pytest.raises(TemplateNotFound):
+            EmailService.render_template('nonexistent.html', {})
@@ -3,6 +3,7 @@ import pytest_asyncio
 from sqlmodel import select
 from app.core.filtering import apply_filters, apply_sorting, apply_search, SortOrder
 from app.modules.users.models import User, UserType
+from app.modules.users.repository import UserRepository
 
 # Mock model for independent testing (or just use User)
 # We will use the existing User model for integration-like unit testing.
@@ -13,7 +14,6 @@ async def test_apply_filters_eq(session):
     # Real integration test requires data in DB.
     
     # Let's write an integration test using the repository.
-    from app.modules.users.repository import UserRepository
     repo = UserRepository(session)
     
     # Create test users with unique marker
@@ -32,7 +32,6 @@ async def test_apply_filters_eq(session):
 
 @pytest.mark.asyncio
 async def test_apply_filters_search(session):
-    from app.modules.users.repository import UserRepository
     repo = UserRepository(session)
     
     await repo.create(User(email="unique1@test.com", hashed_password="pw", user_type=UserType.CUSTOMER, first_name="Zorro", last_name="X"))
@@ -55,8 +54,6 @@ async def test_apply_filters_gt(session):
 
 @pytest.mark.asyncio
 async def test_apply_sorting(session):
-    from app.modules.users.repository import UserRepository
-    from app.modules.users.models import User, UserType
     repo = UserRepository(session)
     
     await repo.create(User(email="sort_a@test.com", hashed_password="pw", user_type=UserType.CUSTOMER, first_name="A", last_name="SortTest"))
@@ -1,11 +1,19 @@
 
 import pytest
 import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 from uuid import uuid4
-from app.core.permissions import get_user_permissions
+from starlette.datastructures import State
+from app.core import permissions
+from app.core.permissions import get_user_permissions, require_permissions
 from app.modules.roles.service import RoleService, PermissionService
 from app.modules.users.service import UserManagementService
 from app.core.cache import get_cache, set_cache, delete_cache, user_permissions_key
+from app.modules.users.schemas import AdminCreate
+from app.modules.users.repository import UserRepository
+from app.modules.roles.models import RolePermission
+from app.modules.users.models import Admin
 
 @pytest.mark.asyncio
 async def test_permission_caching_lag(session, client):
@@ -35,8 +43,6 @@ async def test_permission_caching_lag(session, client):
     # Create Admin User assigned to this role
     email = f"admin_{uuid4()}@example.com"
     # We need a user first... 
-    from app.modules.users.schemas import AdminCreate
-    
     user = await user_service.create_admin(
         data=AdminCreate(
             email=email,
@@ -48,12 +54,10 @@ async def test_permission_caching_lag(session, client):
     )
 
     # Fetch actual User DB object
-    from app.modules.users.repository import UserRepository
     user_repo = UserRepository(session)
     user_db = await user_repo.get(user.user_id)
     
     # DEBUG: Check if RolePermission exists
-    from app.modules.roles.models import RolePermission
     from sqlmodel import select
     res = await session.execute(select(RolePermission).where(RolePermission.role_id == role.id))
     rps = res.all()
@@ -62,7 +66,6 @@ async def test_permission_caching_lag(session, client):
         print(f"[DEBUG] RP: {rp}")
 
     # DEBUG: Check Admin record
-    from app.modules.users.models import Admin
     res_admin = await session.execute(select(Admin).where(Admin.user_id == user.user_id))
     admin_rec = res_admin.scalar_one_or_none()
     print(f"\n[DEBUG] Admin Record: {admin_rec}")
@@ -105,3 +108,18 @@ async def test_permission_caching_lag(session, client):
     
     assert perm_code not in perms_after, "Permission should be removed immediately"
 
+
+
+@pytest.mark.asyncio
+async def test_permissions_resolved_once_per_request(monkeypatch):
+    """Stacked permission checkers in one request share a single lookup."""
+    request = SimpleNamespace(state=State())
+    user = object()
+    
+    mock_get_perms = AsyncMock(return_value=["roles:read", "roles:write"])
+    monkeypatch.setattr(permissions, "get_user_permissions", mock_get_perms)
+    
+    await require_permissions(["roles:read"])(request, user, AsyncMock())
+    await require_permissions(["roles:write"])(request, user, AsyncMock())
+    
+    mock_get_perms.assert_awaited_once()
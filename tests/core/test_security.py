@@ -3,7 +3,7 @@ Comprehensive security and edge case tests.
 Run with: pytest tests/test_security.py -v
 """
 import pytest
-import uuid
+from secrets import token_hex
 
 
 class TestSecurityHeaders:
@@ -84,7 +84,7 @@ class TestInputValidation:
     
     async def test_register_special_chars_in_name(self, client):
         """Test registration with special characters in name."""
-        unique_id = str(uuid.uuid4())[:8]
+        unique_id = token_hex(4)
         response = await client.post(
             "/api/v1/auth/register",
             json={
@@ -3,28 +3,40 @@ Repository layer unit tests.
 Run with: pytest tests/repositories/test_repositories.py -v
 """
 import pytest
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+
+from app.core.base_repository import BaseRepository
+from app.modules.auth.token_models import RefreshToken
+from app.modules.auth.repository import (
+    RefreshTokenRepository,
+    OAuthProviderRepository,
+    OAuthAccountRepository
+)
+from app.modules.oauth.models import OAuthProvider, OAuthAccount
+from app.modules.roles.models import Role, Permission
+from app.modules.roles.repository import RoleRepository, PermissionRepository
+from app.modules.users.models import User, Admin, Customer
+from app.modules.users.repository import UserRepository, AdminRepository, CustomerRepository
 
 
 class TestBaseRepository:
     """Test BaseRepository functionality."""
-    
-    @pytest.fixture
-    def mock_session(self):
-        """Create a mock database session."""
-        session = AsyncMock()
-        session.execute = AsyncMock()
-        session.add = MagicMock()
-        session.commit = AsyncMock()
-        session.refresh = AsyncMock()
-        return session
-    
-    async def test_base_repository_init(self, mock_session):
-        """Test BaseRepository initialization."""
-        from app.core.base_repository import BaseRepository
-        from app.modules.users.models import User
-        
-        repo = BaseRepository(User, mock_session)
-        assert repo.model == User
+
+    @pytest.mark.parametrize("factory,model", [
+        (lambda db: BaseRepository(User, db), User),
+        (UserRepository, User),
+        (AdminRepository, Admin),
+        (CustomerRepository, Customer),
+        (RoleRepository, Role),
+        (PermissionRepository, Permission),
+        (RefreshTokenRepository, RefreshToken),
+        (OAuthProviderRepository, OAuthProvider),
+        (OAuthAccountRepository, OAuthAccount),
+    ], ids=[
+        "base", "user", "admin", "customer", "role", "permission",
+        "refresh_token", "oauth_provider", "oauth_account"
+    ])
+    async def test_repository_init(self, mock_session, factory, model):
+        """Test repositories bind their model and session."""
+        repo = factory(mock_session)
+        assert repo.model == model
         assert repo.db is mock_session
@@ -0,0 +1,26 @@
+"""
+Service layer unit tests.
+Run with: pytest tests/services/test_services.py -v
+"""
+import pytest
+
+from app.modules.auth.service import AuthService
+from app.modules.oauth.provider_service import OAuthProviderService
+from app.modules.oauth.service import OAuthService
+from app.modules.roles.service import RoleService, PermissionService
+
+
+class TestServiceInit:
+    """Test service construction."""
+
+    @pytest.mark.parametrize("service_cls", [
+        AuthService,
+        OAuthService,
+        OAuthProviderService,
+        RoleService,
+        PermissionService,
+    ], ids=["auth", "oauth", "oauth_provider", "role", "permission"])
+    def test_service_init(self, mock_session, service_cls):
+        """Test services keep the session they are given."""
+        service = service_cls(mock_session)
+        assert service.db is mock_session